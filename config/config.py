@@ -3,13 +3,32 @@
 Config Module
 """
 
-import json
+import atexit
 import os
 import re
+import tomllib
+from functools import lru_cache
 from typing import Any
 from pathlib import Path
 
-import toml
+import orjson
+
+# Environment variable references: $VAR, env:VAR, ${VAR}
+_ENV_RE = re.compile(r"(?i)\$(\w+)|env:(\w+)|\$\{(\w+)\}")
+
+
+@lru_cache(maxsize=1024)
+def _expand_env_string(value: str) -> str:
+    """Expand environment variable references in a string."""
+    # Most values hold no references at all, so skip the regex for them.
+    if "$" not in value and ":" not in value:
+        return value
+    return _ENV_RE.sub(
+        lambda match: os.environ.get(
+            match.group(1) or match.group(2) or match.group(3), match.group(0)
+        ),
+        value,
+    )
 
 
 class Config:
@@ -40,26 +59,39 @@ class Config:
             # Initial setup
             cls._instance._conf_file = conf_file
             cls._instance._last_modified = None
+            cls._instance._dirty = False
+            cls._instance.config = {}
+            cls._instance._expanded_config = {}
 
             # Initial load
             cls._instance._load_config(reuse)
 
+            # Persist any pending updates when the process exits.
+            atexit.register(cls._instance.flush)
+
         return cls._instance
 
     @classmethod
     def reset(cls):
-        """Reset the singleton instance to None"""
+        """Persist pending updates and reset the singleton instance to None"""
         # pylint: disable=protected-access
         if cls._instance:
+            cls._instance.flush()
+            atexit.unregister(cls._instance.flush)
             cls._instance._conf_file = None
             cls._instance._last_modified = None
             cls._instance.config = {}
+            cls._instance._expanded_config = {}
             cls._instance = None
+        _expand_env_string.cache_clear()
 
     @classmethod
     def destroy(cls):
         """Remove the lock file and reset the singleton instance"""
+        # pylint: disable=protected-access
         if cls._instance:
+            # The lock file is removed, so pending updates are discarded instead of flushed
+            cls._instance._dirty = False
             if os.path.exists(cls._LOCK_FILE):
                 os.remove(cls._LOCK_FILE)
             cls.reset()
@@ -75,50 +107,94 @@ class Config:
         Exceptions:
             FileNotFound: Thrown if config file is not found
         """
-        self.config = {}
-
-        # Check to see if the config file has been modified, if so, reload the file.
-        if os.path.exists(self._LOCK_FILE) and reuse is True:
-            print("Using aster.lock file to load persistent configurations")
-            with open(self._LOCK_FILE, "r", encoding="utf8") as lock_file:
-                self.config = json.load(lock_file)
-                return
-
-        if self._conf_file:
-            try:
-                current_modified = os.path.getmtime(self._conf_file)
-                if (
-                    self._last_modified is None
-                    or current_modified != self._last_modified
-                    or reuse is False
-                ):
-                    self.config = toml.load(self._conf_file)
-                    self.last_modified = current_modified
-                    self._save_config_state()
-            except FileNotFoundError as exc:
-                raise Exception(
-                    "",
-                    message=f"Configuration file '{self._conf_file}' could not be found.",
-                ) from exc
-    
+        config = self._read_lock_file() if reuse is True else None
+        from_conf_file = config is None and bool(self._conf_file)
+        if config is None:
+            current_modified = self._conf_file_state()
+            config = self._read_config(current_modified)
+            self._last_modified = current_modified
+
+        self.config = config
+        if from_conf_file:
+            # Persist the configuration read from the TOML file for later sessions.
+            self._save_config_state()
+
+        # Environment variables are process-scoped, so expand them once here instead of on every `get`.
+        self._expanded_config = {
+            section: self._expand_section(values)
+            for section, values in self.config.items()
+        }
+
+    def _read_lock_file(self):
+        """Read the persisted configurations from the lock file.
+
+        Returns:
+            dict | None: The raw configurations, or None if there is no lock file.
+        """
+        try:
+            with open(self._LOCK_FILE, "rb") as lock_file:
+                print("Using aster.lock file to load persistent configurations")
+                return orjson.loads(lock_file.read())
+        except FileNotFoundError:
+            return None
+
+    def _read_config(self, current_modified) -> dict:
+        """Read the configurations from the TOML file.
+
+        Args:
+            current_modified: The (mtime, size) of the config file, or None if it is missing.
+
+        Returns:
+            dict: The raw configurations, empty if no config file was specified.
+        """
+        if not self._conf_file:
+            return {}
+
+        if current_modified is None:
+            raise Exception(
+                "",
+                message=f"Configuration file '{self._conf_file}' could not be found.",
+            )
+        with open(self._conf_file, "rb") as conf_file:
+            return tomllib.load(conf_file)
+
+    def _conf_file_state(self):
+        """Return the (mtime, size) of the config file, or None if it is unset or missing."""
+        if not self._conf_file:
+            return None
+        try:
+            st = os.stat(self._conf_file)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def _save_config_state(self):
-        with open(self._LOCK_FILE, "w", encoding="utf8") as f:
-            json.dump(self.config, f, indent=4)
+        # Write to a temporary file and swap it in so a crash never leaves a partial lock file.
+        tmp_file = f"{self._LOCK_FILE}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(self.config))
+        os.replace(tmp_file, self._LOCK_FILE)
+
+    def flush(self) -> None:
+        """Write pending configuration updates to the lock file."""
+        if self._dirty:
+            self._save_config_state()
+            self._dirty = False
 
     @staticmethod
     def _expand_env_variables(value):
         """Expand environment variables in a given value."""
         if isinstance(value, str):
-            # Using regex for various formats like $VAR, env:VAR, ${VAR}
-            return re.sub(
-                r"(?i)\$(\w+)|env:(\w+)|\$\{(\w+)\}",
-                lambda match: os.environ.get(
-                    match.group(1) or match.group(2) or match.group(3), match.group(0)
-                ),
-                value,
-            )
+            return _expand_env_string(value)
         return value
 
+    @classmethod
+    def _expand_section(cls, values):
+        """Expand environment variables in every value of a configuration section."""
+        if isinstance(values, dict):
+            return {key: cls._expand_env_variables(value) for key, value in values.items()}
+        return values
+
     def get(self, section: str, key: str) -> Any:
         """Get any value in a given section.
 
@@ -141,9 +217,7 @@ class Config:
             print (error_message)
             raise Exception("", message=error_message)
 
-        value = self._expand_env_variables(self.config[section][key])
-
-        return value
+        return self._expanded_config[section][key]
     
     def set(self, section: str, key: str, val: Any) -> None:
         """Set any value in a given section.
@@ -152,12 +226,16 @@ class Config:
             section (str): Configuration section.
             key (str): Configuration key.
             val (str): Configuration value to be set.
+
+        The update is persisted to the lock file on `flush()` or at process exit.
         """
         if section not in self.config:
             self.config[section] = {}
+            self._expanded_config[section] = {}
 
         self.config[section][key] = val
-        self._save_config_state()
+        self._expanded_config[section][key] = self._expand_env_variables(val)
+        self._dirty = True
 
     @property
     def LOCK_FILE(self):
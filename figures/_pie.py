@@ -0,0 +1,45 @@
+import matplotlib
+
+# Render straight to file, skip probing for an interactive GUI backend.
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+
+def render_pie(data, out_pdf, annotate_last=3, threshold=1.0):
+    """Render a percentage distribution as a pie chart and save it to a PDF.
+
+    Args:
+        data (dict): Mapping of label to percentage.
+        out_pdf (str): Output file name.
+        annotate_last (int): Number of smallest slices whose label also shows the percentage.
+        threshold (float): Values below this percentage are grouped into 'Other'.
+    """
+    # Group values below the threshold into 'Other'
+    grouped_data = {name: value for name, value in data.items() if value >= threshold}
+    other_total = sum(value for value in data.values() if value < threshold)
+
+    if other_total > 0:
+        grouped_data[f"Other (<{threshold:g}%)"] = other_total
+
+    sorted_items = sorted(grouped_data.items(), key=lambda item: item[1], reverse=True)
+    first_annotated = len(sorted_items) - annotate_last
+
+    # Plot pie chart
+    plt.figure(figsize=(12, 12))
+    plt.pie(
+        [value for _, value in sorted_items],
+        labels=[
+            f"{label} ({value:.2f}%)" if i >= first_annotated else label
+            for i, (label, value) in enumerate(sorted_items)
+        ],
+        autopct=lambda pct: f'{pct:.1f}%' if pct >= 2 else '',  # show % only for slices >= 2%
+        startangle=140,
+        colors=plt.cm.Pastel1.colors,
+        textprops={'fontsize': 20},
+        wedgeprops={'edgecolor': 'black', 'linewidth': 1},
+        labeldistance=1.05  # Move labels closer to the pie
+    )
+
+    plt.tight_layout()
+    plt.savefig(out_pdf, dpi=300, bbox_inches='tight')
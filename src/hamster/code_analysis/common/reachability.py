@@ -1,22 +1,86 @@
-from collections import deque
-import re
+from collections import Counter, defaultdict, deque
+import sys
 from dataclasses import dataclass
-from typing import Any, List, Literal, Optional, Set, Tuple, Dict, Counter, Union
+from functools import lru_cache
+from typing import Any, DefaultDict, FrozenSet, Iterator, List, Literal, Optional, Set, Tuple, Dict, Union
 from cldk.analysis.java import JavaAnalysis
+from cldk.models.java import JCallable
 from hamster.code_analysis.utils import constants
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReachabilityConfig:
     allow_repetition: bool = False  # On same level
     only_helpers: bool = False
     add_extended_class: bool = False
 
 
+# Method modifier flags
+_PUBLIC = 1
+_PRIVATE = 2
+_PROTECTED = 4
+_STATIC = 8
+_ABSTRACT = 16
+
+_MODIFIER_FLAGS: Dict[str, int] = {
+    "public": _PUBLIC,
+    "private": _PRIVATE,
+    "protected": _PROTECTED,
+    "static": _STATIC,
+    "abstract": _ABSTRACT,
+}
+
+# Visibility of a method from its access flags, private taking precedence over public over protected
+_VISIBILITY_MASK = _PUBLIC | _PRIVATE | _PROTECTED
+_VISIBILITY_BY_MASK: Dict[int, str] = {
+    mask: (
+        "private"
+        if mask & _PRIVATE
+        else (
+            "public"
+            if mask & _PUBLIC
+            else "protected" if mask & _PROTECTED else "package-private"
+        )
+    )
+    for mask in range(_VISIBILITY_MASK + 1)
+}
+
+
+@lru_cache(maxsize=None)
+def _simple_class_name(qualified_class_name: str) -> str:
+    return qualified_class_name.rsplit(".", 1)[-1]
+
+
+@dataclass
+class _ReachabilityFrame:
+    """A visited method whose children are still being expanded."""
+
+    basic_key: Tuple[str, str]
+    depth: int
+    reachable_methods: Dict[str, List[str]]
+    children: Iterator[Tuple[Tuple[str, str], int]]
+    add_times: int = 1
+
+
 class Reachability:
     def __init__(self, analysis: JavaAnalysis):
         self.analysis = analysis
-        self._reachability_cache: Dict[Tuple, Dict[str, List[str]]] = {}
+        # Memoized symbol-table lookups shared by all queries on this instance
+        self._get_class = lru_cache(maxsize=None)(analysis.get_class)
+        self._get_method = lru_cache(maxsize=None)(analysis.get_method)
+        self._get_methods_in_class = lru_cache(maxsize=None)(
+            analysis.get_methods_in_class
+        )
+        self._reachability_cache: Dict[Tuple, Dict[str, Tuple[str, ...]]] = {}
+        # Interface -> concrete implementing classes and the set of interfaces, built on first use
+        self._concrete_classes_index: Optional[Dict[str, List[str]]] = None
+        self._interface_classes: Optional[FrozenSet[str]] = None
+        # Class -> all transitive superclasses
+        self._ancestors_cache: Dict[str, FrozenSet[str]] = {}
+        # (class, signature) -> whether the method body is pure ASCII
+        self._ascii_cache: Dict[Tuple[str, str], bool] = {}
+        # (class, signature) -> modifier bitmask
+        self._modifiers_mask_cache: Dict[Tuple[str, str], int] = {}
 
     def get_helper_methods(
         self,
@@ -39,7 +103,7 @@ class Reachability:
         Returns:
             Dict[str, List[str]]: A map from class names to method signatures of helper methods.
         """
-        method_details = self.analysis.get_method(
+        method_details = self._get_method(
             qualified_class_name, method_signature
         )
         visited: Set[Tuple[str, str]] = set()
@@ -55,33 +119,56 @@ class Reachability:
         if reachability_key in self._reachability_cache:
             reachable_methods_by_class = self._reachability_cache[reachability_key]
         else:
-            reachable_methods_by_class: Dict[str, List[str]] = (
-                self._collect_reachable_methods(
+            reachable_methods_by_class = {
+                class_name: tuple(methods)
+                for class_name, methods in self._collect_reachable_methods(
                     qualified_class_name,
                     method_signature,
                     depth,
                     reachability_config,
                     visited,
-                )
-            )
+                ).items()
+            }
             self._reachability_cache[reachability_key] = reachable_methods_by_class
 
         final_reachable_methods: Dict[str, List[str]] = {}
-        for class_name in reachable_methods_by_class:
-            for method_signature in reachable_methods_by_class[class_name]:
-                method = self.analysis.get_method(
-                    qualified_class_name, method_signature
-                )
+        for class_name, methods in reachable_methods_by_class.items():
+            for reachable_signature in methods:
+                # Helpers are resolved against the root class, as the published statistics were computed
+                method = self._get_method(qualified_class_name, reachable_signature)
                 if (
                     method
                     and (class_name != qualified_class_name or method != method_details)
-                    and method.code.isascii()
+                    and self._code_is_ascii(
+                        qualified_class_name, reachable_signature, method
+                    )
                 ):
                     final_reachable_methods.setdefault(class_name, []).append(
-                        method_signature
+                        reachable_signature
                     )
         return final_reachable_methods
 
+    def _code_is_ascii(
+        self, qualified_class_name: str, method_signature: str, method: JCallable
+    ) -> bool:
+        """
+        Checks whether the method body is pure ASCII, scanning each method's code only once.
+
+        Args:
+            qualified_class_name: The qualified name of the class.
+            method_signature: The method signature.
+            method: The method details.
+
+        Returns:
+            bool: True if the method code only contains ASCII characters.
+        """
+        key = (qualified_class_name, method_signature)
+        is_ascii = self._ascii_cache.get(key)
+        if is_ascii is None:
+            is_ascii = method.code.isascii()
+            self._ascii_cache[key] = is_ascii
+        return is_ascii
+
     def _collect_reachable_methods(
         self,
         qualified_class_name: str,
@@ -103,24 +190,96 @@ class Reachability:
         Returns:
             Dict[str, List[str]]: A map from class names to method signatures of reachable methods.
         """
-        if depth < 0:
-            return {}
-
         if visited is None:
             visited: Set[Tuple[str, str]] = set()
 
+        reachable_methods, frame = self._expand_method(
+            qualified_class_name, method_signature, depth, reachability_config, visited
+        )
+        if frame is None:
+            return reachable_methods
+
+        # Walk the call hierarchy depth-first with an explicit stack instead of recursion
+        stack: List[_ReachabilityFrame] = [frame]
+        while stack:
+            frame = stack[-1]
+            child = next(frame.children, None)
+            if child is not None:
+                (child_class, child_sig), num_calls = child
+                if reachability_config.allow_repetition:
+                    frame.add_times = num_calls
+                else:
+                    frame.add_times = 1
+                child_reachable_methods, child_frame = self._expand_method(
+                    child_class,
+                    child_sig,
+                    frame.depth - 1,
+                    reachability_config,
+                    visited,
+                )
+                if child_frame is not None:
+                    stack.append(child_frame)
+                    continue
+            else:
+                # All children are processed, hand the result over to the parent
+                stack.pop()
+
+                # This will allow a parent to revisit at the same level
+                if reachability_config.allow_repetition:
+                    visited.remove(frame.basic_key)
+
+                child_reachable_methods = frame.reachable_methods
+                if not stack:
+                    break
+                frame = stack[-1]
+
+            add_times = frame.add_times
+            for child_c_class, methods_list in child_reachable_methods.items():
+                methods = frame.reachable_methods.setdefault(child_c_class, [])
+                if add_times == 1:
+                    methods.extend(methods_list)
+                else:
+                    methods.extend(methods_list * add_times)
+
+        return child_reachable_methods
+
+    def _expand_method(
+        self,
+        qualified_class_name: str,
+        method_signature: str,
+        depth: int,
+        reachability_config: ReachabilityConfig,
+        visited: Set[Tuple[str, str]],
+    ) -> Tuple[Dict[str, List[str]], Optional["_ReachabilityFrame"]]:
+        """
+        Visits a method during reachability collection and gathers the methods it calls.
+
+        Args:
+            qualified_class_name: The qualified name of the class.
+            method_signature: The method signature.
+            depth: The depth for search in call hierarchy.
+            reachability_config: The configurations for reachability computation.
+            visited: The set of tuples that have already been visited.
+
+        Returns:
+            Tuple[Dict[str, List[str]], Optional[_ReachabilityFrame]]: The reachable methods of the
+            method, and the frame holding its children if they still need to be expanded.
+        """
+        if depth < 0:
+            return {}, None
+
         # Normalize constructors
-        simple_class_name = qualified_class_name.split(".")[-1]
-        if method_signature.startswith(f"{simple_class_name}("):
-            method_signature = method_signature.replace(
-                f"{simple_class_name}(", "<init>("
-            )
+        method_name, paren, parameters = method_signature.partition("(")
+        if paren and method_name == _simple_class_name(qualified_class_name):
+            method_signature = "<init>(" + parameters
 
+        qualified_class_name = sys.intern(qualified_class_name)
+        method_signature = sys.intern(method_signature)
         basic_key = (qualified_class_name, method_signature)
 
         # Check for an existing depth-level duplicate
         if basic_key in visited:
-            return {}
+            return {}, None
         visited.add(basic_key)
 
         reachability_key = self._get_reachability_key(
@@ -129,15 +288,15 @@ class Reachability:
 
         # Check if already expanded in cache
         if reachability_key in self._reachability_cache:
-            return self._reachability_cache[reachability_key]
+            return self._reachability_cache[reachability_key], None
 
-        method_details = self.analysis.get_method(
+        method_details = self._get_method(
             qualified_class_name, method_signature
         )
 
         # Check for ensuring valid method
         if not method_details:
-            return {}
+            return {}, None
 
         # Seed result dictionary with the current method to start
         reachable_methods: Dict[str, List[str]] = {
@@ -147,30 +306,31 @@ class Reachability:
         # Determine extended classes if needed
         extend_list = []
         if reachability_config.add_extended_class:
-            class_details = self.analysis.get_class(qualified_class_name)
+            class_details = self._get_class(qualified_class_name)
             extend_list = class_details.extends_list if class_details else []
 
         child_counter: Counter[Tuple[str, str]] = Counter()
 
         # Handle interface-based call sites
-        interface_map: Dict[str, List[str]] = {}
+        interface_map: DefaultDict[str, List[str]] = defaultdict(list)
         for site in method_details.call_sites:
             receiver = site.receiver_type
-            receiver_class = self.analysis.get_class(receiver)
-            if receiver_class and receiver_class.is_interface:
-                processed_sig = site.callee_signature
-                interface_map.setdefault(receiver, []).append(processed_sig)
+            if self._is_interface(receiver):
+                interface_map[receiver].append(site.callee_signature)
 
         # For all call sites with interface receiver types, collect the method signature
-        for interface, callee_sigs in interface_map.items():
-            for concrete_class in self.get_concrete_classes(interface_class=interface):
-                # All concrete classes that implement interface
-                if (
-                    not reachability_config.only_helpers
-                    or concrete_class == qualified_class_name
-                ) or concrete_class in extend_list:
-                    for callee_sig in callee_sigs:
-                        child_counter[(concrete_class, callee_sig)] += 1
+        # of every concrete class that implements the interface
+        child_counter.update(
+            (concrete_class, callee_sig)
+            for interface, callee_sigs in interface_map.items()
+            for concrete_class in self.get_concrete_classes(interface_class=interface)
+            if (
+                not reachability_config.only_helpers
+                or concrete_class == qualified_class_name
+            )
+            or concrete_class in extend_list
+            for callee_sig in callee_sigs
+        )
 
         # Handle direct symbol-table callees
         callees = self.analysis.get_callees(
@@ -192,25 +352,14 @@ class Reachability:
                 #     raise Exception("A called method has no calling lines...")
                 child_counter[(callee_class, callee_sig)] += num_calls
 
-        # Now process unique children
-        for child_key, num_calls in child_counter.items():
-            child_class, child_sig = child_key
-            child_reachable_methods = self._collect_reachable_methods(
-                child_class, child_sig, depth - 1, reachability_config, visited
-            )
-            if reachability_config.allow_repetition:
-                add_times = num_calls
-            else:
-                add_times = 1
-            for _ in range(add_times):
-                for child_c_class, methods_list in child_reachable_methods.items():
-                    reachable_methods.setdefault(child_c_class, []).extend(methods_list)
-
-        # This will allow a parent to revisit at the same level
-        if reachability_config.allow_repetition:
-            visited.remove(basic_key)
-
-        return reachable_methods
+        # Unique children are processed by the caller
+        frame = _ReachabilityFrame(
+            basic_key=basic_key,
+            depth=depth,
+            reachable_methods=reachable_methods,
+            children=iter(child_counter.items()),
+        )
+        return reachable_methods, frame
 
     def get_concrete_classes(self, interface_class: str) -> List[str]:
         """
@@ -222,16 +371,39 @@ class Reachability:
         Returns:
             List[str]: List of concrete classes that implement the given interface class.
         """
-        all_classes_in_application = self.analysis.get_classes()
-        concrete_classes = []
-        for qualified_class, class_details in all_classes_in_application.items():
-            if (
-                not class_details.is_interface
-                and "abstract" not in class_details.modifiers
-            ):
-                if interface_class in class_details.implements_list:
-                    concrete_classes.append(qualified_class)
-        return concrete_classes
+        if self._concrete_classes_index is None:
+            self._build_class_indexes()
+        return list(self._concrete_classes_index.get(interface_class, []))
+
+    def _is_interface(self, qualified_class_name: str) -> bool:
+        """
+        Checks whether the given class is an interface declared in the application.
+
+        Args:
+            qualified_class_name: The qualified name of the class.
+
+        Returns:
+            bool: True if the class is an interface.
+        """
+        if self._interface_classes is None:
+            self._build_class_indexes()
+        return qualified_class_name in self._interface_classes
+
+    def _build_class_indexes(self) -> None:
+        """
+        Builds the interface set and the map from each interface to the concrete classes that implement it in a
+        single pass over all classes.
+        """
+        concrete_classes_index: DefaultDict[str, List[str]] = defaultdict(list)
+        interface_classes: Set[str] = set()
+        for qualified_class, class_details in self.analysis.get_classes().items():
+            if class_details.is_interface:
+                interface_classes.add(qualified_class)
+            elif "abstract" not in class_details.modifiers:
+                for interface_class in dict.fromkeys(class_details.implements_list):
+                    concrete_classes_index[interface_class].append(qualified_class)
+        self._concrete_classes_index = dict(concrete_classes_index)
+        self._interface_classes = frozenset(interface_classes)
 
     def _get_reachability_key(
         self,
@@ -250,12 +422,11 @@ class Reachability:
         Returns:
             Tuple: A unique reachability key.
         """
+        # Interned names let cache lookups compare strings by identity
         reachability_key = (
-            qualified_class_name,
-            method_signature,
-            reachability_config.allow_repetition,
-            reachability_config.add_extended_class,
-            reachability_config.only_helpers,
+            sys.intern(qualified_class_name),
+            sys.intern(method_signature),
+            reachability_config,
         )
         return reachability_key
 
@@ -283,7 +454,7 @@ class Reachability:
         Raises:
             ClassNotFoundError: If the qualified_class_name cannot be found.
         """
-        root_details = self.analysis.get_class(qualified_class_name)
+        root_details = self._get_class(qualified_class_name)
         if not root_details:
             raise Exception(
                 f"Class {qualified_class_name} not found.",
@@ -299,18 +470,12 @@ class Reachability:
             )
 
         def _meta(owner: str, method_sig: str) -> Dict[str, Any]:
-            method_details = self.analysis.get_method(owner, method_sig)
+            method_details = self._get_method(owner, method_sig)
             owner_pkg = self.package_of(owner)
             mods = list(method_details.modifiers) if method_details else []
-            visibility = (
-                "private"
-                if "private" in mods
-                else (
-                    "public"
-                    if "public" in mods
-                    else "protected" if "protected" in mods else "package-private"
-                )
-            )
+            visibility = _VISIBILITY_BY_MASK[
+                self._modifiers_mask(owner, method_sig) & _VISIBILITY_MASK
+            ]
             return {
                 "method_signature": method_sig,
                 "declaring_qualified_class_name": owner,
@@ -322,7 +487,7 @@ class Reachability:
         seen_sigs: set[str] = set()
 
         def _add_methods(owner: str) -> None:
-            for method_sig in self.analysis.get_methods_in_class(owner):
+            for method_sig in self._get_methods_in_class(owner):
                 if method_sig in seen_sigs:
                     continue
                 if _accept(owner, method_sig):
@@ -345,7 +510,7 @@ class Reachability:
             super_bfs_order.append(sup_cls)
             _add_methods(sup_cls)
 
-            sup_details = self.analysis.get_class(sup_cls)
+            sup_details = self._get_class(sup_cls)
             if sup_details and sup_details.extends_list:
                 for next_sup in sup_details.extends_list:
                     if next_sup not in visited_supers:
@@ -357,7 +522,7 @@ class Reachability:
         visited_ifaces: set[str] = set()
 
         def _enqueue_interfaces(owner: str) -> None:
-            owner_details = self.analysis.get_class(owner)
+            owner_details = self._get_class(owner)
             if owner_details and owner_details.implements_list:
                 for iface in owner_details.implements_list:
                     if iface not in visited_ifaces:
@@ -372,7 +537,7 @@ class Reachability:
             iface = iface_queue.popleft()
             _add_methods(iface)
 
-            iface_details = self.analysis.get_class(iface)
+            iface_details = self._get_class(iface)
             if iface_details and iface_details.extends_list:
                 for parent_iface in iface_details.extends_list:
                     if parent_iface not in visited_ifaces:
@@ -389,26 +554,26 @@ class Reachability:
         accessor_class: Optional[str] = None,
         mode: Literal["public", "same_package", "same_package_or_subclass"] = "public",
     ) -> bool:
-        class_details = self.analysis.get_class(owner_class)
+        class_details = self._get_class(owner_class)
         if not class_details:
             raise Exception(
                 f"Class {owner_class} not found.",
             )
 
-        method_details = self.analysis.get_method(owner_class, method_signature)
+        method_details = self._get_method(owner_class, method_signature)
         if not method_details:
             raise Exception(
                 f"Method {method_signature} not found in class {owner_class}.",
             )
 
-        mods = set(method_details.modifiers)
+        mods = self._modifiers_mask(owner_class, method_signature)
         owner_pkg = self.package_of(owner_class)
 
         # Public methods and interface/annotation non-private methods are always visible
-        if "public" in mods:
+        if mods & _PUBLIC:
             return True
         if class_details.is_interface or class_details.is_annotation_declaration:
-            if "private" not in mods:
+            if not mods & _PRIVATE:
                 return True
 
         # Implicit public constructor for public class
@@ -428,7 +593,7 @@ class Reachability:
 
         # Same package rules
         if owner_pkg == acc_pkg:
-            if "private" in mods:
+            if mods & _PRIVATE:
                 return False
             return True
         # Protected and package-private allowed in same package
@@ -439,7 +604,7 @@ class Reachability:
 
         # Check for subclass inheritance of protected method
         if (
-            "protected" in mods
+            mods & _PROTECTED
             and accessor_class
             and self.is_subclass_of(accessor_class, owner_class)
         ):
@@ -447,31 +612,66 @@ class Reachability:
 
         return False
 
+    def _modifiers_mask(self, qualified_class_name: str, method_signature: str) -> int:
+        """
+        Returns the modifiers of a method as a bitmask of the _PUBLIC, _PRIVATE, _PROTECTED, _STATIC and _ABSTRACT
+        flags. The mask is computed once per method.
+
+        Args:
+            qualified_class_name: The qualified name of the class.
+            method_signature: The method signature.
+
+        Returns:
+            int: The modifier bitmask, 0 if the method cannot be found.
+        """
+        key = (qualified_class_name, method_signature)
+        mask = self._modifiers_mask_cache.get(key)
+        if mask is None:
+            method_details = self._get_method(qualified_class_name, method_signature)
+            mask = 0
+            if method_details:
+                for modifier in method_details.modifiers:
+                    mask |= _MODIFIER_FLAGS.get(modifier, 0)
+            self._modifiers_mask_cache[key] = mask
+        return mask
+
     def is_subclass_of(self, sub_class: str, super_class: str) -> bool:
         if not sub_class or not super_class or sub_class == super_class:
             return False
 
-        sub_info = self.analysis.get_class(sub_class)
-        if not sub_info:
-            return False
+        return super_class in self._ancestors(sub_class)
 
-        stack = sub_info.extends_list
-        seen = set()
+    def _ancestors(self, qualified_class_name: str) -> FrozenSet[str]:
+        """
+        Returns all superclasses reachable from the given class through its extends lists. The result is cached per class.
 
-        while stack:
-            curr = stack.pop()
-            if curr in seen:
-                continue
-            if curr == super_class:
-                return True
-            seen.add(curr)
+        Args:
+            qualified_class_name: The qualified name of the class.
+
+        Returns:
+            FrozenSet[str]: The transitive superclasses of the class.
+        """
+        ancestors = self._ancestors_cache.get(qualified_class_name)
+        if ancestors is not None:
+            return ancestors
+
+        seen: Set[str] = set()
+        class_info = self._get_class(qualified_class_name)
+        if class_info:
+            queue: deque[str] = deque(class_info.extends_list)
+            while queue:
+                curr = queue.popleft()
+                if curr in seen:
+                    continue
+                seen.add(curr)
 
-            curr_info = self.analysis.get_class(curr)
-            if curr_info:
-                parents = curr_info.extends_list
-                stack.extend(parents)
+                curr_info = self._get_class(curr)
+                if curr_info:
+                    queue.extend(curr_info.extends_list)
 
-        return False
+        ancestors = frozenset(seen)
+        self._ancestors_cache[qualified_class_name] = ancestors
+        return ancestors
 
     @staticmethod
     def package_of(qualified_class_name: str) -> str:
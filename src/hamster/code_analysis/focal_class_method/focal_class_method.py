@@ -26,6 +26,8 @@ class FocalClassMethod:
         language = Language(java_language.language())
         self.parser = Parser(language=language)
         self.application_classes = [cls for cls in application_classes]
+        # Membership checks against application classes run for every type and call site
+        self.application_class_set = frozenset(self.application_classes)
         self.assertion_methods = self.__get_assertion_methods()
 
     @staticmethod
@@ -261,7 +263,7 @@ class FocalClassMethod:
         for param in method.parameters:
             types = self.base_types(param.type)
             for type in types:
-                if self.analysis.get_class(type) is not None and type in self.application_classes:
+                if self.analysis.get_class(type) is not None and type in self.application_class_set:
                     is_application_class_used = True
                     variables[param.name] = type
                     parameter_types.append([param.name, type])
@@ -270,7 +272,7 @@ class FocalClassMethod:
             types = self.base_types(variable_declaration.type)
             for type in types:
                 # Process only application classes
-                if self.analysis.get_class(type) is not None and type in self.application_classes:
+                if self.analysis.get_class(type) is not None and type in self.application_class_set:
                     is_application_class_used = True
                     variables[variable_declaration.name] = type
                 else:
@@ -281,7 +283,7 @@ class FocalClassMethod:
         # Go through the call sites to get the constructor calls
         for call_site in method.call_sites:
             if call_site.is_constructor_call:
-                if self.analysis.get_class(call_site.return_type) is not None and call_site.return_type in self.application_classes:
+                if self.analysis.get_class(call_site.return_type) is not None and call_site.return_type in self.application_class_set:
                     is_application_class_used = True
                     for variable in all_variables:
                         if variable[1].split('.')[-1] == call_site.return_type.split('.')[-1]:
@@ -294,7 +296,7 @@ class FocalClassMethod:
                 # Scenario 1: For static call add the receiver types
                 if call_site.is_static_call:
                     for type in types:
-                        if self.analysis.get_class(type) is not None and type in self.application_classes:
+                        if self.analysis.get_class(type) is not None and type in self.application_class_set:
                             is_application_class_used = True
                             static_types[type.lower()] = type
                             # If the call site is part of an assignment statement
@@ -306,7 +308,7 @@ class FocalClassMethod:
                                     variables[v_decl[1]] = type
                 # Add that to the list of potential focal methods
                 for type in types:
-                    if self.analysis.get_class(type) is not None and type in self.application_classes:
+                    if self.analysis.get_class(type) is not None and type in self.application_class_set:
                         is_application_class_used = True
                         callee_signature = ''
                         if any(call_site.method_name.startswith(getter_method) for getter_method in GETTER_METHODS):
@@ -324,7 +326,7 @@ class FocalClassMethod:
                 # Scenario 2: Add return type and check if matches with the declared fields
                 types.extend(self.base_types(call_site.return_type))
                 for type in types:
-                    if self.analysis.get_class(type) is not None and type in self.application_classes:
+                    if self.analysis.get_class(type) is not None and type in self.application_class_set:
                         is_application_class_used = True
                         for variable in all_variables:
                             if variable[1].split('.')[-1] == type.split('.')[-1]:
@@ -334,7 +336,7 @@ class FocalClassMethod:
                     receiver_types = self.base_types(call_site.receiver_type)
                     for receiver_type in receiver_types:
                         receiver_class_details = self.analysis.get_class(receiver_type)
-                        if receiver_class_details is not None and receiver_type in self.application_classes:
+                        if receiver_class_details is not None and receiver_type in self.application_class_set:
                             is_application_class_used = True
                             if 'static' in receiver_class_details.modifiers:
                                 variables[receiver_type.lower()] = receiver_type
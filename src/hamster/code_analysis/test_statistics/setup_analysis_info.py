@@ -96,6 +96,33 @@ class SetupAnalysisInfo:
             if signatures
         }
 
+    def get_setup_method_details_batch(
+        self,
+        qualified_class_name: str,
+        method_signatures: List[str],
+        testing_frameworks: List[TestingFramework],
+    ) -> List[SetupAnalysis]:
+        """
+        Retrieves the analyses of several setup methods declared in the same class, analyzing each distinct signature once.
+
+        Args:
+            qualified_class_name: The fully qualified name of the class declaring the methods.
+            method_signatures: The signatures of the setup methods to analyze.
+            testing_frameworks: List of testing frameworks used by the class.
+
+        Returns:
+            List[SetupAnalysis]: The analysis of each setup method, in the order of the given signatures.
+        """
+        details_by_signature: Dict[str, SetupAnalysis] = {
+            method_signature: self.get_setup_method_details(
+                qualified_class_name,
+                method_signature,
+                testing_frameworks,
+            )
+            for method_signature in dict.fromkeys(method_signatures)
+        }
+        return [details_by_signature[signature] for signature in method_signatures]
+
     def get_setup_method_details(
         self,
         qualified_class_name: str,
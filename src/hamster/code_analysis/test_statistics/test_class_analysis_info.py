@@ -8,16 +8,26 @@ from .test_method_analysis_info import TestMethodAnalysisInfo
 
 from hamster.code_analysis.model.models import (
     TestClassAnalysis,
+    TestMethodAnalysis,
     TestingFramework,
     SetupAnalysis,
     TeardownAnalysis,
 )
 from hamster.code_analysis.common import CommonAnalysis
+from hamster.code_analysis.utils.constants import BDD_TEST_FRAMEWORKS
+
+_BDD_FRAMEWORKS: frozenset[TestingFramework] = frozenset(BDD_TEST_FRAMEWORKS)
 
 
 class TestClassAnalysisInfo:
+    # Test order dependence is not detected yet, every class is reported with this value
+    is_order_dependent_default: bool = False
+
     def __init__(
-        self, analysis: JavaAnalysis, dataset_name: str, application_classes: List[str]
+        self,
+        analysis: JavaAnalysis,
+        dataset_name: str,
+        application_classes: List[str],
     ) -> None:
         """
         Initializes the TestClassAnalysisInfo with the given analysis, dataset name, and application classes.
@@ -30,6 +40,16 @@ class TestClassAnalysisInfo:
         self.analysis = analysis
         self.dataset_name = dataset_name
         self.application_classes = application_classes
+        self._common = CommonAnalysis(self.analysis)
+        self._setup_info = SetupAnalysisInfo(self.analysis)
+        self._teardown_info = TeardownAnalysisInfo(self.analysis)
+        self._test_method_info = TestMethodAnalysisInfo(
+            analysis=self.analysis,
+            dataset_name=self.dataset_name,
+            application_classes=self.application_classes,
+        )
+        # Testing frameworks per class, shared by test classes and their setup/teardown declaring classes
+        self._frameworks_cache: Dict[str, List[TestingFramework]] = {}
 
     def get_test_class_analysis(
         self, qualified_class_name: str, test_methods: List[str] | None
@@ -43,50 +63,60 @@ class TestClassAnalysisInfo:
 
         Returns:
             TestClassAnalysis: The analysis object for the test class.
+
+        Raises:
+            ValueError: If no test methods are given.
         """
         if not test_methods:
-            raise Exception(
-                "Called test class analysis on class with no test methods..."
+            raise ValueError(
+                f"Called test class analysis on {qualified_class_name} with no test methods"
             )
 
-        testing_frameworks = CommonAnalysis(
-            self.analysis
-        ).get_testing_frameworks_for_class(qualified_class_name=qualified_class_name)
-        setup_analyses_info = self.get_setup_analysis_info(
-            test_class_qualified_name=qualified_class_name
+        testing_frameworks = self._frameworks_for(qualified_class_name)
+
+        # Setup methods are shared by the setup analysis and every test method analysis
+        setup_methods_by_class: Dict[str, List[str]] = (
+            self._setup_info.get_setup_methods(
+                qualified_class_name=qualified_class_name,
+            )
         )
-        teardown_analyses_info = self.get_teardown_analysis_info(
-            test_class_qualified_name=qualified_class_name
+        setup_analyses_info: List[SetupAnalysis] = self.get_setup_analysis_info(
+            test_class_qualified_name=qualified_class_name,
+            setup_methods=setup_methods_by_class,
         )
-        is_order_dependent = self._is_test_order_dependent(
+        teardown_analyses_info = self.get_teardown_analysis_info(
             test_class_qualified_name=qualified_class_name
         )
+        is_order_dependent = self.is_order_dependent_default
         is_bdd = self._is_bdd(testing_frameworks=testing_frameworks)
 
-        setup_methods_by_class: Dict[str, List[str]] = SetupAnalysisInfo(
-            self.analysis
-        ).get_setup_methods(
-            qualified_class_name=qualified_class_name,
+        get_test_method_analysis_info = (
+            self._test_method_info.get_test_method_analysis_info
         )
 
-        test_method_analysis = TestMethodAnalysisInfo(
-            analysis=self.analysis,
-            dataset_name=self.dataset_name,
-            application_classes=self.application_classes,
-        )
+        def analyze_test_method(test_method: str) -> TestMethodAnalysis:
+            return get_test_method_analysis_info(
+                testing_frameworks=testing_frameworks,
+                qualified_class_name=qualified_class_name,
+                method_signature=test_method,
+                setup_methods=setup_methods_by_class,
+            )
 
-        # Analyze each test method individually
-        test_method_analyses = []
-        for test_method in test_methods:
-            test_method_analysis_info = (
-                test_method_analysis.get_test_method_analysis_info(
-                    testing_frameworks=testing_frameworks,
-                    qualified_class_name=qualified_class_name,
-                    method_signature=test_method,
-                    setup_methods=setup_methods_by_class,
-                )
+        # Analyze each distinct test method once; duplicates reuse the same analysis
+        unique_methods = list(dict.fromkeys(test_methods))
+        unique_analyses = [
+            analyze_test_method(test_method) for test_method in unique_methods
+        ]
+
+        if len(unique_methods) == len(test_methods):
+            test_method_analyses = unique_analyses
+        else:
+            analyses_by_signature: Dict[str, TestMethodAnalysis] = dict(
+                zip(unique_methods, unique_analyses)
             )
-            test_method_analyses.append(test_method_analysis_info)
+            test_method_analyses = [
+                analyses_by_signature[test_method] for test_method in test_methods
+            ]
 
         # Construct and return the TestClassAnalysis object with all collected data
         return TestClassAnalysis(
@@ -99,6 +129,24 @@ class TestClassAnalysisInfo:
             is_bdd=is_bdd,
         )
 
+    def _frameworks_for(self, qualified_class_name: str) -> List[TestingFramework]:
+        """
+        Retrieves the testing frameworks used by a class, querying the analysis only once per class.
+
+        Args:
+            qualified_class_name: The fully qualified name of the class.
+
+        Returns:
+            List[TestingFramework]: The testing frameworks used by the class.
+        """
+        testing_frameworks = self._frameworks_cache.get(qualified_class_name)
+        if testing_frameworks is None:
+            testing_frameworks = self._common.get_testing_frameworks_for_class(
+                qualified_class_name=qualified_class_name
+            )
+            self._frameworks_cache[qualified_class_name] = testing_frameworks
+        return testing_frameworks
+
     @staticmethod
     def _is_bdd(testing_frameworks: List[TestingFramework]) -> bool:
         """
@@ -110,73 +158,82 @@ class TestClassAnalysisInfo:
         Returns:
             bool: True if any BDD framework is present, False otherwise.
         """
-        return any(
-            testing_framework
-            in [
-                TestingFramework.SPOCK,
-                TestingFramework.CUCUMBER,
-                TestingFramework.JBEHAVE,
-                TestingFramework.SERENITY,
-                TestingFramework.GAUGE,
-            ]
-            for testing_framework in testing_frameworks
-        )
+        return not _BDD_FRAMEWORKS.isdisjoint(testing_frameworks)
 
     def get_setup_analysis_info(
-        self, test_class_qualified_name: str
+        self,
+        test_class_qualified_name: str,
+        setup_methods: Dict[str, List[str]] | None = None,
     ) -> List[SetupAnalysis]:
-        setup_methods: Dict[str, List[str]] = SetupAnalysisInfo(
-            self.analysis
-        ).get_setup_methods(
-            test_class_qualified_name,
-        )
+        """
+        Retrieves the analyses of the setup methods that apply to a test class.
+
+        Args:
+            test_class_qualified_name: The fully qualified name of the test class.
+            setup_methods: Setup method signatures by declaring class, if already computed.
+
+        Returns:
+            List[SetupAnalysis]: The analysis of each setup method.
+        """
+        if setup_methods is None:
+            setup_methods = self._setup_info.get_setup_methods(
+                test_class_qualified_name,
+            )
 
         if not setup_methods:
             return []
 
         # Collect detailed analyses for each setup method
         setup_analyses: List[SetupAnalysis] = []
-        common_analysis = CommonAnalysis(self.analysis)
+        get_details_batch = self._setup_info.get_setup_method_details_batch
+        frameworks_for = self._frameworks_for
         for declaring_class, method_signatures in setup_methods.items():
-            frameworks_for_class = common_analysis.get_testing_frameworks_for_class(
-                qualified_class_name=declaring_class
-            )
-            for setup_method in method_signatures:
-                setup_analyses.append(
-                    SetupAnalysisInfo(self.analysis).get_setup_method_details(
-                        declaring_class, setup_method, frameworks_for_class
-                    )
+            if not method_signatures:
+                continue
+            frameworks_for_class = frameworks_for(declaring_class)
+            setup_analyses.extend(
+                get_details_batch(
+                    declaring_class, method_signatures, frameworks_for_class
                 )
+            )
 
         return setup_analyses
 
     def get_teardown_analysis_info(
-        self, test_class_qualified_name: str
+        self,
+        test_class_qualified_name: str,
+        teardown_methods: Dict[str, List[str]] | None = None,
     ) -> List[TeardownAnalysis]:
-        teardown_methods: Dict[str, List[str]] = TeardownAnalysisInfo(
-            self.analysis
-        ).get_teardown_methods(
-            test_class_qualified_name,
-        )
+        """
+        Retrieves the analyses of the teardown methods that apply to a test class.
+
+        Args:
+            test_class_qualified_name: The fully qualified name of the test class.
+            teardown_methods: Teardown method signatures by declaring class, if already computed.
+
+        Returns:
+            List[TeardownAnalysis]: The analysis of each teardown method.
+        """
+        if teardown_methods is None:
+            teardown_methods = self._teardown_info.get_teardown_methods(
+                test_class_qualified_name,
+            )
 
         if not teardown_methods:
             return []
 
         # Collect detailed analyses for each teardown method
         teardown_analyses: List[TeardownAnalysis] = []
-        common_analysis = CommonAnalysis(self.analysis)
+        get_details_batch = self._teardown_info.get_teardown_method_details_batch
+        frameworks_for = self._frameworks_for
         for declaring_class, method_signatures in teardown_methods.items():
-            frameworks_for_class = common_analysis.get_testing_frameworks_for_class(
-                qualified_class_name=declaring_class
-            )
-            for teardown_method in method_signatures:
-                teardown_analyses.append(
-                    TeardownAnalysisInfo(self.analysis).get_teardown_method_details(
-                        declaring_class, teardown_method, frameworks_for_class
-                    )
+            if not method_signatures:
+                continue
+            frameworks_for_class = frameworks_for(declaring_class)
+            teardown_analyses.extend(
+                get_details_batch(
+                    declaring_class, method_signatures, frameworks_for_class
                 )
+            )
 
         return teardown_analyses
-
-    def _is_test_order_dependent(self, test_class_qualified_name: str) -> bool:
-        return False
@@ -18,6 +18,13 @@ class TestMethodAnalysisInfo:
         self.analysis = analysis
         self.dataset_name = dataset_name
         self.application_classes = application_classes
+        self._common = CommonAnalysis(self.analysis)
+        # Indexes the application classes once instead of once per test method.
+        # It owns a stateful tree-sitter parser, so it must only be used from one thread at a time.
+        self._focal_class_method = FocalClassMethod(
+            analysis=self.analysis,
+            application_classes=self.application_classes,
+        )
 
     def get_test_method_analysis_info(self,
                                       testing_frameworks: List[TestingFramework],
@@ -67,8 +74,7 @@ class TestMethodAnalysisInfo:
             setup_methods,
         )
 
-        # Initialize common analysis utility
-        common_analysis = CommonAnalysis(self.analysis)
+        common_analysis = self._common
 
         # Compute metrics for the test method itself
         ncloc: int = common_analysis.get_ncloc(method_declaration, method_details.code)
@@ -98,24 +104,28 @@ class TestMethodAnalysisInfo:
             allow_repetition=True
         )
 
-        # Include the original method in the set of methods to analyze
-        all_methods = helper_methods
-        all_methods.setdefault(qualified_class_name, []).append(method_signature)
+        # Include the original method after its class's helpers, without mutating the helper mapping
+        all_methods: List[Tuple[str, str]] = []
+        for class_name, method_sigs in helper_methods.items():
+            all_methods.extend((class_name, method_sig) for method_sig in method_sigs)
+            if class_name == qualified_class_name:
+                all_methods.append((qualified_class_name, method_signature))
+        if qualified_class_name not in helper_methods:
+            all_methods.append((qualified_class_name, method_signature))
 
         # Aggregate metrics from all methods (test + helpers)
-        for class_name in all_methods:
-            for method_sig in all_methods[class_name]:
-                method = self.analysis.get_method(class_name, method_sig)
-                if not method:
-                    continue
-
-                is_mocking_used = self.__is_mocking_used(class_name, method.signature) or is_mocking_used
-                number_of_objects_created += self.__get_number_of_objects_created(method)
-                cyclomatic_complexity_with_helpers += method.cyclomatic_complexity if method.cyclomatic_complexity else 0
-                ncloc_with_helpers += common_analysis.get_ncloc(method.declaration, method.code)
-                constructor_call_details.extend(common_analysis.get_constructor_call_details(method))
-                application_call_details.extend(common_analysis.get_application_call_details(method))
-                library_call_details.extend(common_analysis.get_library_call_details(method))
+        for class_name, method_sig in all_methods:
+            method = self.analysis.get_method(class_name, method_sig)
+            if not method:
+                continue
+
+            is_mocking_used = self.__is_mocking_used(class_name, method.signature) or is_mocking_used
+            number_of_objects_created += self.__get_number_of_objects_created(method)
+            cyclomatic_complexity_with_helpers += method.cyclomatic_complexity if method.cyclomatic_complexity else 0
+            ncloc_with_helpers += common_analysis.get_ncloc(method.declaration, method.code)
+            constructor_call_details.extend(common_analysis.get_constructor_call_details(method))
+            application_call_details.extend(common_analysis.get_application_call_details(method))
+            library_call_details.extend(common_analysis.get_library_call_details(method))
 
         # Initialize mocking-related variables
         number_of_mocks_created = 0
@@ -123,25 +133,25 @@ class TestMethodAnalysisInfo:
         mocked_resources = []
         # Collect mocking details only if mocking is detected
         if is_mocking_used:
-            for class_name in all_methods:
-                for method_sig in all_methods[class_name]:
-                    method = self.analysis.get_method(class_name, method_sig)
-                    if not method:
-                        continue
-
-                    # Use SetupAnalysisInfo to gather mocking details (applies to test methods too)
-                    mocked_details = SetupAnalysisInfo(self.analysis).get_setup_method_details(
-                        qualified_class_name=class_name,
-                        method_signature=method.signature,
-                        testing_frameworks=testing_frameworks,
-                        is_test_method=True
-                    )
-                    number_of_mocks_created += mocked_details.number_of_mocks_created
-                    if mocking_frameworks_used is None:
-                        mocking_frameworks_used = mocked_details.mocking_frameworks_used
-                    method_mocked_resources = mocked_details.mocked_resources
-                    if method_mocked_resources is not None:
-                        mocked_resources.extend(method_mocked_resources)
+            # Use SetupAnalysisInfo to gather mocking details (applies to test methods too)
+            get_mocking_details = SetupAnalysisInfo(self.analysis).get_setup_method_details
+            for class_name, method_sig in all_methods:
+                method = self.analysis.get_method(class_name, method_sig)
+                if not method:
+                    continue
+
+                mocked_details = get_mocking_details(
+                    qualified_class_name=class_name,
+                    method_signature=method.signature,
+                    testing_frameworks=testing_frameworks,
+                    is_test_method=True
+                )
+                number_of_mocks_created += mocked_details.number_of_mocks_created
+                if mocking_frameworks_used is None:
+                    mocking_frameworks_used = mocked_details.mocking_frameworks_used
+                method_mocked_resources = mocked_details.mocked_resources
+                if method_mocked_resources is not None:
+                    mocked_resources.extend(method_mocked_resources)
 
         # Retrieve call and assertion sequence details
         call_assertion_sequences = (
@@ -196,14 +206,10 @@ class TestMethodAnalysisInfo:
         """
         # Identify focal classes and flags for UI/API test detection
         focal_classes, is_application_classed_used, is_ui_test, is_api_test = \
-            (
-                FocalClassMethod(
-                    analysis=self.analysis,
-                    application_classes=self.application_classes,
-                )
-             .identify_focal_class_and_ui_api_test(test_class_name=test_class_qualified_name,
-                                                  test_method_signature=test_method_signature,
-                                                  setup_methods=setup_methods))
+            self._focal_class_method.identify_focal_class_and_ui_api_test(
+                test_class_name=test_class_qualified_name,
+                test_method_signature=test_method_signature,
+                setup_methods=setup_methods)
 
         # Classify test type based on flags and focal class count
         if is_ui_test:
@@ -224,7 +230,7 @@ class TestMethodAnalysisInfo:
     def __is_mocking_used(self,
                           test_class_qualified_name: str,
                           method_signature: str) -> bool:
-        return CommonAnalysis(self.analysis).is_mocking_used(test_class_qualified_name, method_signature) > 0
+        return self._common.is_mocking_used(test_class_qualified_name, method_signature) > 0
 
     def __get_number_of_objects_created(self, method_details: JCallable) -> int:
         """
@@ -236,4 +242,4 @@ class TestMethodAnalysisInfo:
         Returns:
             int: The count of constructor calls (objects created).
         """
-        return len(CommonAnalysis(self.analysis).get_constructor_call_details(method_details))
+        return len(self._common.get_constructor_call_details(method_details))
@@ -1,6 +1,7 @@
 import re
 from pathlib import Path
-from typing import Dict, Set, List
+from types import MappingProxyType
+from typing import Dict, Set, List, Mapping
 
 from hamster.code_analysis.model.models import TestingFramework, AssertionType, ParameterType, CleanupType, InputType, \
     TestType
@@ -407,6 +408,13 @@ testing_frameworks_by_type = {
     ],
 }
 
+# Testing framework to its group; built in reverse so the first group listing a framework wins
+TESTING_FRAMEWORK_TO_GROUP: Mapping[str, str] = MappingProxyType({
+    framework: group
+    for group, frameworks in reversed(testing_frameworks_by_type.items())
+    for framework in frameworks
+})
+
 BUILTIN_ASSERTION_COMPLEMENTS: Dict[AssertionType, Set[str]] = {
     AssertionType.EQUALITY: {
         "equals",
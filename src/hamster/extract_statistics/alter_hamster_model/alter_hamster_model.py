@@ -1,17 +1,25 @@
 import glob
-import json
+import itertools
 import os
 import traceback
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 
+import orjson
 import ray
 from cldk import CLDK
 from cldk.analysis import AnalysisLevel
+from cldk.analysis.java import JavaAnalysis
+from cldk.models.java import JCallable
 
 from hamster.code_analysis.common import CommonAnalysis, Reachability
 from hamster.code_analysis.focal_class_method.focal_class_method import FocalClassMethod
-from hamster.code_analysis.model.models import ProjectAnalysis, TestingFramework
+from hamster.code_analysis.model.models import (
+    ProjectAnalysis,
+    TestClassAnalysis,
+    TestingFramework,
+)
 from hamster.code_analysis.test_statistics import (
     CallAndAssertionSequenceDetailsInfo,
     SetupAnalysisInfo,
@@ -27,43 +35,186 @@ store_path = "/home/hamster/xvdc/hamster_results/new_model"  # Rename accordingl
 
 
 class HamsterModelAlterer:
-    def __init__(self, analysis_path: str, project_analysis_file: str, store_path: str):
-        self.analysis = CLDK(language="java").analysis(
-            project_path="",
-            analysis_backend_path=None,
-            analysis_level=AnalysisLevel.symbol_table,
-            analysis_json_path=analysis_path,
-        )
-        with open(project_analysis_file, "r") as f:
-            file_content = json.load(f)
-            self.project_analysis = ProjectAnalysis.model_validate(file_content)
+    def __init__(
+        self,
+        analysis_path: str,
+        project_analysis_file: str,
+        store_path: str,
+        analysis: JavaAnalysis | None = None,
+        reachability_factory: Callable[[JavaAnalysis], Reachability] = Reachability,
+    ):
+        """
+        Loads the Hamster model to alter together with the analysis of its project.
+
+        Args:
+            analysis_path: Path of the stored CLDK symbol table.
+            project_analysis_file: Path of the Hamster model to alter.
+            store_path: Path the altered Hamster model is saved to.
+            analysis: An already built analysis, used instead of loading one from analysis_path.
+            reachability_factory: Builds the Reachability used to compute the helper methods of each method.
+        """
+        if analysis is None:
+            analysis = CLDK(language="java").analysis(
+                project_path="",
+                analysis_backend_path=None,
+                analysis_level=AnalysisLevel.symbol_table,
+                analysis_json_path=analysis_path,
+            )
+        self.analysis = analysis
+        self._reachability_factory = reachability_factory
+        with open(project_analysis_file, "rb") as f:
+            self.project_analysis = ProjectAnalysis.model_validate_json(f.read())
         self.store_path = store_path
-        _, self.application_classes = CommonAnalysis(
-            self.analysis
-        ).get_test_methods_classes_and_application_classes()
+        self._common_analysis = CommonAnalysis(self.analysis)
+        _, self.application_classes = (
+            self._common_analysis.get_test_methods_classes_and_application_classes()
+        )
+        # Reachable helper methods and NCLOC per (class, method), shared by all alter passes
+        self._helper_cache: Dict[Tuple[str, str], List[Tuple[str, str, int]]] = {}
+        self._ncloc_cache: Dict[Tuple[str, str], int] = {}
+        self._method_cache: Dict[Tuple[str, str], JCallable | None] = {}
+        self._setup_analysis = SetupAnalysisInfo(self.analysis)
+        self._setup_methods_cache: Dict[str, Dict[str, List[str]]] = {}
+
+    def _get_setup_methods(self, qualified_class_name: str) -> Dict[str, List[str]]:
+        """
+        Retrieves the setup methods visible to a test class, computing them once per class.
+
+        Args:
+            qualified_class_name: The fully qualified name of the test class.
+
+        Returns:
+            Dict[str, List[str]]: Mapping of declaring class to its setup method signatures.
+        """
+        setup_methods = self._setup_methods_cache.get(qualified_class_name)
+        if setup_methods is None:
+            setup_methods = self._setup_analysis.get_setup_methods(
+                qualified_class_name=qualified_class_name,
+            )
+            self._setup_methods_cache[qualified_class_name] = setup_methods
+        return setup_methods
+
+    def _get_method(
+        self, qualified_class_name: str, method_signature: str
+    ) -> JCallable | None:
+        """
+        Retrieves a method from the analysis, looking each (class, method) pair up only once.
+
+        Args:
+            qualified_class_name: The fully qualified name of the class.
+            method_signature: The signature of the method.
+
+        Returns:
+            JCallable | None: The method details, or None if the method is not found.
+        """
+        key = (qualified_class_name, method_signature)
+        try:
+            return self._method_cache[key]
+        except KeyError:
+            method_details = self.analysis.get_method(
+                qualified_class_name, method_signature
+            )
+            self._method_cache[key] = method_details
+            return method_details
+
+    def _helpers(
+        self, qualified_class_name: str, method_signature: str
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Retrieves the helper methods reachable from a method, computing them once per method.
+
+        Args:
+            qualified_class_name: The fully qualified name of the class.
+            method_signature: The signature of the method.
+
+        Returns:
+            List[Tuple[str, str, int]]: The class, signature and number of occurrences of each distinct helper method.
+                The cached list is shared, do not mutate it.
+        """
+        key = (qualified_class_name, method_signature)
+        helpers = self._helper_cache.get(key)
+        if helpers is None:
+            # A fresh Reachability per root: its cache prunes roots reached from earlier roots
+            helper_methods: Dict[str, List[str]] = self._reachability_factory(
+                self.analysis
+            ).get_helper_methods(
+                qualified_class_name,
+                method_signature,
+                add_extended_class=True,
+                allow_repetition=True,
+            )
+            # Repeated helpers are kept as a count, so each one is looked up and measured once
+            occurrences = Counter(
+                (class_name, method_sig)
+                for class_name, method_sigs in helper_methods.items()
+                for method_sig in method_sigs
+            )
+            helpers = [
+                (class_name, method_sig, count)
+                for (class_name, method_sig), count in occurrences.items()
+            ]
+            self._helper_cache[key] = helpers
+        return helpers
+
+    def _ncloc(
+        self, class_name: str, method_signature: str, method_details: JCallable
+    ) -> int:
+        """
+        Computes the NCLOC of a method, once per method.
+
+        Args:
+            class_name: The fully qualified name of the class declaring the method.
+            method_signature: The signature of the method.
+            method_details: The method details from the analysis.
+
+        Returns:
+            int: The number of non-comment lines of code.
+        """
+        key = (class_name, method_signature)
+        ncloc = self._ncloc_cache.get(key)
+        if ncloc is None:
+            ncloc = self._common_analysis.get_ncloc(
+                method_details.declaration, method_details.code
+            )
+            self._ncloc_cache[key] = ncloc
+        return ncloc
+
+    def _for_each_class(self, alter_class: Callable[[TestClassAnalysis], None]) -> None:
+        """
+        Applies an alteration to every test class of the project.
+
+        Args:
+            alter_class: Alters a single test class in place.
+        """
+        test_class_analyses = self.project_analysis.test_class_analyses
+        with ProgressBarFactory.get_progress_bar() as p:
+            for cls in p.track(
+                test_class_analyses,
+                total=len(test_class_analyses),
+            ):
+                alter_class(cls)
 
     def alter_focal_class(self):
         """
         Alter the focal class details.
         """
+        focal_class_method = FocalClassMethod(
+            analysis=self.analysis,
+            application_classes=self.application_classes,
+        )
         with ProgressBarFactory.get_progress_bar() as p:
             for cls in p.track(
                 self.project_analysis.test_class_analyses,
                 total=len(self.project_analysis.test_class_analyses),
             ):
-                setup_methods = SetupAnalysisInfo(self.analysis).get_setup_methods(
-                    qualified_class_name=cls.qualified_class_name,
-                )
+                setup_methods = self._get_setup_methods(cls.qualified_class_name)
                 for method in cls.test_method_analyses:
                     (
                         focal_classes,
                         is_application_classed_used,
                         is_ui_test,
                         is_api_test,
-                    ) = FocalClassMethod(
-                        analysis=self.analysis,
-                        application_classes=self.application_classes,
-                    ).identify_focal_class_and_ui_api_test(
+                    ) = focal_class_method.identify_focal_class_and_ui_api_test(
                         test_class_name=cls.qualified_class_name,
                         test_method_signature=method.method_signature,
                         setup_methods=setup_methods,
@@ -106,7 +257,6 @@ class HamsterModelAlterer:
         test_class_analysis = None
         call_assertion_details = None
         test_method_analysis = None
-        setup_analysis = None
 
         if alter_class_fixtures:
             test_class_analysis = TestClassAnalysisInfo(
@@ -126,55 +276,52 @@ class HamsterModelAlterer:
                 dataset_name=dataset_name,
                 application_classes=self.application_classes,
             )
-            setup_analysis = SetupAnalysisInfo(self.analysis)
 
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                if alter_class_fixtures:
-                    cls.setup_analyses = test_class_analysis.get_setup_analysis_info(
+        def alter_class(cls: TestClassAnalysis) -> None:
+            # Resolved once and shared by the fixture refresh and the test type analysis
+            setup_methods = None
+            if alter_class_fixtures or alter_test_type:
+                setup_methods = self._get_setup_methods(cls.qualified_class_name)
+
+            if alter_class_fixtures:
+                cls.setup_analyses = test_class_analysis.get_setup_analysis_info(
+                    test_class_qualified_name=cls.qualified_class_name,
+                    setup_methods=setup_methods,
+                )
+                cls.teardown_analyses = (
+                    test_class_analysis.get_teardown_analysis_info(
                         test_class_qualified_name=cls.qualified_class_name
                     )
-                    cls.teardown_analyses = (
-                        test_class_analysis.get_teardown_analysis_info(
-                            test_class_qualified_name=cls.qualified_class_name
-                        )
-                    )
-
-                needs_method_iteration = alter_call_assertion_sequences or (
-                    alter_test_type and alter_focal_class
                 )
 
-                if not needs_method_iteration or not cls.test_method_analyses:
-                    continue
+            needs_method_iteration = alter_call_assertion_sequences or (
+                alter_test_type and alter_focal_class
+            )
 
-                testing_frameworks = cls.testing_frameworks
-                setup_methods = None
-                if alter_test_type and alter_focal_class:
-                    setup_methods = setup_analysis.get_setup_methods(
+            if not needs_method_iteration or not cls.test_method_analyses:
+                return
+
+            testing_frameworks = cls.testing_frameworks
+            for method in cls.test_method_analyses:
+                if alter_call_assertion_sequences:
+                    method.call_assertion_sequences = call_assertion_details.get_call_and_assertion_sequence_details_info(
                         qualified_class_name=cls.qualified_class_name,
+                        method_signature=method.method_signature,
+                        testing_frameworks=testing_frameworks,
                     )
 
-                for method in cls.test_method_analyses:
-                    if alter_call_assertion_sequences:
-                        method.call_assertion_sequences = call_assertion_details.get_call_and_assertion_sequence_details_info(
-                            qualified_class_name=cls.qualified_class_name,
-                            method_signature=method.method_signature,
-                            testing_frameworks=testing_frameworks,
+                if alter_test_type and alter_focal_class:
+                    test_type, focal_classes = (
+                        test_method_analysis.get_test_type_focal_classes(
+                            cls.qualified_class_name,
+                            method.method_signature,
+                            setup_methods,
                         )
+                    )
+                    method.test_type = test_type
+                    method.focal_classes = focal_classes
 
-                    if alter_test_type and alter_focal_class:
-                        test_type, focal_classes = (
-                            test_method_analysis.get_test_type_focal_classes(
-                                cls.qualified_class_name,
-                                method.method_signature,
-                                setup_methods,
-                            )
-                        )
-                        method.test_type = test_type
-                        method.focal_classes = focal_classes
+        self._for_each_class(alter_class)
 
     def alter_call_assertion_sequences(self):
         """
@@ -229,9 +376,7 @@ class HamsterModelAlterer:
                 self.project_analysis.test_class_analyses,
                 total=len(self.project_analysis.test_class_analyses),
             ):
-                testing_frameworks = CommonAnalysis(
-                    self.analysis
-                ).get_testing_frameworks_for_class(
+                testing_frameworks = self._common_analysis.get_testing_frameworks_for_class(
                     qualified_class_name=cls.qualified_class_name
                 )
                 if TestingFramework.ROBOTIUM in testing_frameworks:
@@ -239,320 +384,153 @@ class HamsterModelAlterer:
                 if TestingFramework.APPIUM in testing_frameworks:
                     cls.testing_frameworks.append(TestingFramework.APPIUM)
 
-    def alter_method_for_cyclo(self):
+    def _alter_method_metrics(
+        self,
+        *,
+        ncloc: bool = False,
+        cyclo: bool = False,
+        helper_methods: bool = False,
+        qualified_class: bool = False,
+        include_fixtures: bool = False,
+    ) -> None:
         """
-        Alter the method's cyclomatic complexity.
+        Recomputes the requested method metrics in a single pass over the test classes.
+
+        Args:
+            ncloc: Whether to alter the NCLOC and NCLOC with helpers.
+            cyclo: Whether to alter the cyclomatic complexity and cyclomatic complexity with helpers.
+            helper_methods: Whether to alter the number of helper methods and their NCLOC.
+            qualified_class: Whether to set the qualified class name on each analysis.
+            include_fixtures: Whether to alter setup and teardown analyses besides test methods.
         """
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                for method in cls.test_method_analyses:
-                    qualified_class_name = cls.qualified_class_name
-                    method_signature = method.method_signature
+        needs_ncloc = ncloc or helper_methods
 
-                    method_details = self.analysis.get_method(
-                        qualified_class_name, method_signature
-                    )
-                    if not method_details:
-                        continue
+        def alter_class(cls: TestClassAnalysis) -> None:
+            qualified_class_name = cls.qualified_class_name
+            if include_fixtures:
+                all_analyses = [
+                    *cls.setup_analyses,
+                    *cls.teardown_analyses,
+                    *cls.test_method_analyses,
+                ]
+            else:
+                all_analyses = cls.test_method_analyses
 
-                    helper_methods: Dict[str, List[str]] = Reachability(
-                        self.analysis
-                    ).get_helper_methods(
-                        qualified_class_name,
-                        method_signature,
-                        add_extended_class=True,
-                        allow_repetition=True,
-                    )
+            for analysis_obj in all_analyses:
+                method_signature = analysis_obj.method_signature
 
-                    all_methods = helper_methods
-                    all_methods.setdefault(qualified_class_name, []).append(
-                        method_signature
-                    )
+                method_details = self._get_method(
+                    qualified_class_name, method_signature
+                )
+                if not method_details:
+                    continue
+
+                # Helper totals first; the method's own metrics are added on top
+                helpers = self._helpers(qualified_class_name, method_signature)
+                helper_method_count = 0
+                helper_ncloc = 0
+                helper_cyclo = 0
+                for class_name, method_sig, count in helpers:
+                    helper_method_count += count
+                    helper_details = self._get_method(class_name, method_sig)
+                    if helper_details is None:
+                        continue
+                    if needs_ncloc:
+                        helper_ncloc += count * self._ncloc(
+                            class_name, method_sig, helper_details
+                        )
+                    if cyclo:
+                        helper_cyclo += count * (
+                            helper_details.cyclomatic_complexity
+                            if helper_details.cyclomatic_complexity
+                            else 0
+                        )
 
-                    cyclomatic_complexity_with_helpers = 0
-                    for class_name in all_methods:
-                        for method_sig in all_methods[class_name]:
-                            method_details = self.analysis.get_method(
-                                class_name, method_sig
-                            )
-                            if not method_details:
-                                continue
-
-                            cyclomatic_complexity_with_helpers += (
-                                method_details.cyclomatic_complexity
-                                if method_details.cyclomatic_complexity
-                                else 0
-                            )
-
-                    method.cyclomatic_complexity_with_helpers = (
-                        cyclomatic_complexity_with_helpers
+                if ncloc:
+                    method_ncloc = self._ncloc(
+                        qualified_class_name, method_signature, method_details
                     )
-                    method.cyclomatic_complexity = (
+                    analysis_obj.ncloc = method_ncloc
+                    analysis_obj.ncloc_with_helpers = method_ncloc + helper_ncloc
+                if cyclo:
+                    method_cyclo = (
                         method_details.cyclomatic_complexity
                         if method_details.cyclomatic_complexity
                         else 0
                     )
+                    analysis_obj.cyclomatic_complexity = method_cyclo
+                    analysis_obj.cyclomatic_complexity_with_helpers = (
+                        method_cyclo + helper_cyclo
+                    )
+                if helper_methods:
+                    analysis_obj.number_of_helper_methods = helper_method_count
+                    analysis_obj.helper_method_ncloc = helper_ncloc
+                if qualified_class:
+                    analysis_obj.qualified_class_name = qualified_class_name
+
+        self._for_each_class(alter_class)
+
+    def alter_method_for_cyclo(self):
+        """
+        Alter the method's cyclomatic complexity.
+        """
+        self._alter_method_metrics(cyclo=True)
 
     def alter_method_for_helper_methods(self):
         """
         Alter method analysis to add helper methods details.
         """
-        common_analysis = CommonAnalysis(self.analysis)
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                qualified_class_name = cls.qualified_class_name
-                all_analyses = cls.test_method_analyses
-                for analysis_obj in all_analyses:
-                    method_signature = analysis_obj.method_signature
-
-                    method_details = self.analysis.get_method(
-                        qualified_class_name, method_signature
-                    )
-                    if not method_details:
-                        continue
-
-                    helper_methods: Dict[str, List[str]] = Reachability(
-                        self.analysis
-                    ).get_helper_methods(
-                        qualified_class_name,
-                        method_signature,
-                        add_extended_class=True,
-                        allow_repetition=True,
-                    )
-                    all_methods = helper_methods
-                    helper_method_count = 0
-                    for klazz in helper_methods:
-                        helper_method_count += len(helper_methods[klazz])
-                    helper_ncloc = sum(
-                        common_analysis.get_ncloc(
-                            helper_details.declaration, helper_details.code
-                        )
-                        for class_name in all_methods
-                        for method_sig in all_methods[class_name]
-                        if (
-                            helper_details := self.analysis.get_method(
-                                class_name, method_sig
-                            )
-                        )
-                        is not None
-                    )
-                    analysis_obj.number_of_helper_methods = helper_method_count
-                    analysis_obj.helper_method_ncloc = helper_ncloc
+        self._alter_method_metrics(helper_methods=True)
 
     def alter_method_for_ncloc(self):
         """
         Alter method's AND fixture method's NCLOC, and also add NCLOC with helpers.
         """
-        common_analysis = CommonAnalysis(self.analysis)
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                qualified_class_name = cls.qualified_class_name
-                all_analyses = [
-                    *cls.setup_analyses,
-                    *cls.teardown_analyses,
-                    *cls.test_method_analyses,
-                ]
-                for analysis_obj in all_analyses:
-                    method_signature = analysis_obj.method_signature
-
-                    method_details = self.analysis.get_method(
-                        qualified_class_name, method_signature
-                    )
-                    if not method_details:
-                        continue
-
-                    ncloc = common_analysis.get_ncloc(
-                        method_details.declaration, method_details.code
-                    )
-
-                    helper_methods: Dict[str, List[str]] = Reachability(
-                        self.analysis
-                    ).get_helper_methods(
-                        qualified_class_name,
-                        method_signature,
-                        add_extended_class=True,
-                        allow_repetition=True,
-                    )
-
-                    all_methods = helper_methods
-                    all_methods.setdefault(qualified_class_name, []).append(
-                        method_signature
-                    )
-
-                    ncloc_with_helpers = sum(
-                        common_analysis.get_ncloc(
-                            helper_details.declaration, helper_details.code
-                        )
-                        for class_name in all_methods
-                        for method_sig in all_methods[class_name]
-                        if (
-                            helper_details := self.analysis.get_method(
-                                class_name, method_sig
-                            )
-                        )
-                        is not None
-                    )
-
-                    analysis_obj.ncloc = ncloc
-                    analysis_obj.ncloc_with_helpers = ncloc_with_helpers
+        self._alter_method_metrics(ncloc=True, include_fixtures=True)
 
     def alter_method_for_ncloc_and_qualified_class(self):
         """
         Alter method's AND fixture method's NCLOC, and also add NCLOC with helpers.
         Also, add qualified class name to each.
         """
-        common_analysis = CommonAnalysis(self.analysis)
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                qualified_class_name = cls.qualified_class_name
-                all_analyses = [
-                    *cls.setup_analyses,
-                    *cls.teardown_analyses,
-                    *cls.test_method_analyses,
-                ]
-                for analysis_obj in all_analyses:
-                    method_signature = analysis_obj.method_signature
-
-                    method_details = self.analysis.get_method(
-                        qualified_class_name, method_signature
-                    )
-                    if not method_details:
-                        continue
-
-                    ncloc = common_analysis.get_ncloc(
-                        method_details.declaration, method_details.code
-                    )
-
-                    helper_methods: Dict[str, List[str]] = Reachability(
-                        self.analysis
-                    ).get_helper_methods(
-                        qualified_class_name,
-                        method_signature,
-                        add_extended_class=True,
-                        allow_repetition=True,
-                    )
-
-                    all_methods = helper_methods
-                    all_methods.setdefault(qualified_class_name, []).append(
-                        method_signature
-                    )
-
-                    ncloc_with_helpers = sum(
-                        common_analysis.get_ncloc(
-                            helper_details.declaration, helper_details.code
-                        )
-                        for class_name in all_methods
-                        for method_sig in all_methods[class_name]
-                        if (
-                            helper_details := self.analysis.get_method(
-                                class_name, method_sig
-                            )
-                        )
-                        is not None
-                    )
-
-                    analysis_obj.ncloc = ncloc
-                    analysis_obj.ncloc_with_helpers = ncloc_with_helpers
-                    analysis_obj.qualified_class_name = qualified_class_name
+        self._alter_method_metrics(
+            ncloc=True, qualified_class=True, include_fixtures=True
+        )
 
     def alter_method_for_ncloc_cyclo_qualified(self):
         """
         Alter method's AND fixture method's NCLOC, and also add NCLOC with helpers.
         Also, add qualified class name to each.
         """
-        common_analysis = CommonAnalysis(self.analysis)
-        with ProgressBarFactory.get_progress_bar() as p:
-            for cls in p.track(
-                self.project_analysis.test_class_analyses,
-                total=len(self.project_analysis.test_class_analyses),
-            ):
-                qualified_class_name = cls.qualified_class_name
-                all_analyses = [
-                    *cls.setup_analyses,
-                    *cls.teardown_analyses,
-                    *cls.test_method_analyses,
-                ]
-                for analysis_obj in all_analyses:
-                    method_signature = analysis_obj.method_signature
-
-                    method_details = self.analysis.get_method(
-                        qualified_class_name, method_signature
-                    )
-                    if not method_details:
-                        continue
-
-                    ncloc = common_analysis.get_ncloc(
-                        method_details.declaration, method_details.code
-                    )
-                    cyclo_complexity = (
-                        method_details.cyclomatic_complexity
-                        if method_details.cyclomatic_complexity
-                        else 0
-                    )
-
-                    helper_methods: Dict[str, List[str]] = Reachability(
-                        self.analysis
-                    ).get_helper_methods(
-                        qualified_class_name,
-                        method_signature,
-                        add_extended_class=True,
-                        allow_repetition=True,
-                    )
-
-                    all_methods = helper_methods
-                    all_methods.setdefault(qualified_class_name, []).append(
-                        method_signature
-                    )
-
-                    ncloc_with_helpers = 0
-                    cyclo_with_helpers = 0
-                    for class_name in all_methods:
-                        for method_sig in all_methods[class_name]:
-                            if (
-                                helper_details := self.analysis.get_method(
-                                    class_name, method_sig
-                                )
-                            ) is not None:
-                                ncloc_with_helpers += common_analysis.get_ncloc(
-                                    helper_details.declaration, helper_details.code
-                                )
-                                cyclo_with_helpers += (
-                                    helper_details.cyclomatic_complexity
-                                    if helper_details.cyclomatic_complexity
-                                    else 0
-                                )
-
-                    analysis_obj.ncloc = ncloc
-                    analysis_obj.ncloc_with_helpers = ncloc_with_helpers
-                    analysis_obj.cyclomatic_complexity = cyclo_complexity
-                    analysis_obj.cyclomatic_complexity_with_helpers = cyclo_with_helpers
-                    analysis_obj.qualified_class_name = qualified_class_name
+        self._alter_method_metrics(
+            ncloc=True, cyclo=True, qualified_class=True, include_fixtures=True
+        )
 
     def save(self):
         """
         Save the altered project analysis to the store path.
         """
-        project_analysis_str = self.project_analysis.model_dump_json()
-        output_dir = Path(self.store_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.store_path, "w") as f:
-            f.write(project_analysis_str)
+        project_analysis_bytes = orjson.dumps(
+            self.project_analysis.model_dump(mode="json")
+        )
+        output_path = Path(self.store_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Swap the file in whole so an interrupted run never leaves a truncated model behind
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        tmp_path.write_bytes(project_analysis_bytes)
+        os.replace(tmp_path, output_path)
 
 
-@ray.remote
-def alter_hamster_model(file):
+def _alter_hamster_file(file: str) -> bool:
+    """
+    Alters and saves a single Hamster model.
+
+    Args:
+        file: Path of the hamster.json file to alter.
+
+    Returns:
+        bool: True if the model was altered and saved, False if it failed.
+    """
     try:
         directory_name = (
             file.replace(hamster_analysis_parent_directory, "")
@@ -582,21 +560,55 @@ def alter_hamster_model(file):
         alterer.alter_call_assert_seq_and_class_fixture_and_test_type_and_focal_method()
 
         alterer.save()
+        return True
 
     except Exception as e:
         print(f"Error parsing hamster.json from: {file} {e}")
+        return False
+
+
+@ray.remote
+def alter_hamster_models(files: List[str]) -> int:
+    """
+    Alters several Hamster models in one task, amortizing the task overhead over the batch.
+
+    Args:
+        files: Paths of the hamster.json files to alter.
+
+    Returns:
+        int: The number of files altered and saved successfully.
+    """
+    return sum(_alter_hamster_file(file) for file in files)
 
 
 if __name__ == "__main__":
     pattern = os.path.join(hamster_analysis_parent_directory, "**", "hamster.json")
-    all_files = glob.glob(pattern, recursive=True)
+    # Files are discovered lazily, so the first tasks start while the directory walk continues
+    pending_files = glob.iglob(pattern, recursive=True)
     print("Loading Hamster analyses from files...")
-    print(f"Processing {len(all_files)} total repositories...")
-    ray_tasks = [alter_hamster_model.remote(file) for file in all_files]
-    try:
-        ray.get(ray_tasks)
-    except Exception:
-        traceback.print_exc()
-
+    if not ray.is_initialized():
+        ray.init()
+    # Each task alters a batch of files, and a bounded window of tasks is kept in flight
+    files_per_task = 8
+    pending_batches = iter(
+        lambda: list(itertools.islice(pending_files, files_per_task)), []
+    )
+    max_in_flight = 4 * int(ray.cluster_resources().get("CPU", 1))
+    pending = [
+        alter_hamster_models.remote(files)
+        for files in itertools.islice(pending_batches, max_in_flight)
+    ]
+    processed_count = 0
+    while pending:
+        done, pending = ray.wait(pending, num_returns=1)
+        try:
+            processed_count += ray.get(done[0])
+        except Exception:
+            traceback.print_exc()
+        next_files = next(pending_batches, None)
+        if next_files is not None:
+            pending.append(alter_hamster_models.remote(next_files))
+
+    print(f"Processed {processed_count} total repositories...")
     print("Completed model generation...")
     ray.shutdown()
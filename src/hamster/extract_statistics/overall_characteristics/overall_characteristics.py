@@ -1,9 +1,10 @@
 import json
+from array import array
+from collections import defaultdict
 from pathlib import Path
-from typing import List
+from typing import DefaultDict, Dict, List, Set
 
 import numpy as np
-import pandas as pd
 
 from hamster.code_analysis.model.models import (
     ProjectAnalysis,
@@ -11,8 +12,9 @@ from hamster.code_analysis.model.models import (
     TestType,
     TestingFramework,
     ExecutionOrder,
+    FixtureAnalysis,
 )
-from hamster.code_analysis.utils.constants import testing_frameworks_by_type
+from hamster.code_analysis.utils.constants import TESTING_FRAMEWORK_TO_GROUP
 from hamster.extract_statistics.utils import ExtractStatisticsUtils, TopK
 from hamster.utils.output_format import OutputFormatType
 from hamster.utils.pretty import ProgressBarFactory
@@ -35,21 +37,24 @@ class OverallCharacteristics:
         total_application_method = []
         total_test_methods = []
         total_cc = []
-        test_framework_per_class = {}
+        test_framework_per_class: DefaultDict[str, int] = defaultdict(int)
         testing_frameworks = []
-        test_nc_loc = []
+        # Per-class and per-test metrics are filled into arrays sized up front
+        class_total = sum(len(pa.test_class_analyses) for pa in self.all_project_analyses)
+        test_method_total = sum(
+            len(tc.test_method_analyses) for pa in self.all_project_analyses for tc in pa.test_class_analyses
+        )
+        test_nc_loc = np.empty(test_method_total, dtype=np.int64)
+        test_method_index = 0
         fixtures_per_project = []
-        fixtures_per_class = []
-        setup_per_class = []
-        teardown_per_class = []
-        fixtures_before_class_total = 0
-        fixtures_after_class_total = 0
-        fixtures_before_each_test_total = 0
-        fixtures_after_each_test_total = 0
+        fixtures_per_class = np.empty(class_total, dtype=np.int64)
+        setup_per_class = np.empty(class_total, dtype=np.int64)
+        teardown_per_class = np.empty(class_total, dtype=np.int64)
+        fixture_order_counts: Dict[ExecutionOrder, int] = dict.fromkeys(ExecutionOrder, 0)
         classes_with_setup = 0
         classes_with_teardown = 0
         testing_frameworks_per_project = {}
-        app_types = {}
+        app_types: DefaultDict[str, int] = defaultdict(int)
         total_test_class = 0
         test_class_per_project = []
         android_projects = []
@@ -58,87 +63,77 @@ class OverallCharacteristics:
         test_types = []
         focal_classes = []
         focal_methods = []
-        one_or_more_focal_class = []
+        one_focal_class_count = 0
+        more_than_one_focal_class_count = 0
+        no_focal_class_count = 0
         unit_module_focal_method_one_focal_method = 0
         unit_module_focal_method_gt_one_focal_method = 0
-        focal_class_vs_focal_method_count = []
+        # Focal class and focal method counts of each test with focal classes, kept as parallel arrays
+        focal_class_counts = array('i')
+        focal_method_counts = array('i')
         no_focal_method_found = 0
-        testing_framework_upset_diagram = {}
+        testing_framework_upset_diagram: Dict[str, Set[str]] = defaultdict(set)
         top_num_tests_methods_in_class = TopK(10, "number of test methods in class", keep_largest=True)
 
+        def count_fixtures(fixture_analyses: List[FixtureAnalysis | None]) -> int:
+            # Counts the fixtures of a class and tallies their execution orders
+            fixture_count = 0
+            for fixture_analysis in fixture_analyses:
+                if fixture_analysis is None:
+                    continue
+                fixture_count += 1
+                execution_order = fixture_analysis.execution_order
+                if execution_order is not None:
+                    fixture_order_counts[execution_order] += 1
+            return fixture_count
+
+        # Enum members compared for every test method, bound once as locals
+        unit_module_type = TestType.UNIT_MODULE
+        api_type = TestType.API
+        focal_test_types = frozenset((TestType.UNIT_MODULE, TestType.INTEGRATION))
+
         # Go through each project and collect details
         print("Processing project-level statistics...")
         with ProgressBarFactory.get_progress_bar() as p:
             for project_analysis in p.track(self.all_project_analyses, total=len(self.all_project_analyses)):
-                frameworks_in_project = []
+                dataset_name = project_analysis.dataset_name
+                application_types = project_analysis.application_types
+                application_class_count = project_analysis.application_class_count
+                application_method_count = project_analysis.application_method_count
+                application_cyclomatic_complexity = project_analysis.application_cyclomatic_complexity
+                test_class_analyses = project_analysis.test_class_analyses
+                frameworks_in_project: Set[str] = set()
                 total_projects += 1
                 tests_per_project = 0
                 test_class_count = 0
                 test_method_count = 0
                 total_fixtures = 0
 
-                for a_type in project_analysis.application_types:
-                    if a_type.value not in app_types:
-                        app_types[a_type.value] = 1
-                    else:
-                        app_types[a_type.value] += 1
-                for test_class in project_analysis.test_class_analyses:
+                for a_type in application_types:
+                    app_types[a_type.value] += 1
+                if AppType.ANDROID in application_types:
+                    android_projects.append(dataset_name)
+                if not test_class_analyses:
+                    # Projects without test classes only count towards app types and fixtures per project
+                    fixtures_per_project.append(0)
+                    continue
+
+                for test_class in test_class_analyses:
+                    class_index = total_test_class
                     total_test_class += 1
                     test_class_count += 1
-                    for test_framework_in_class in test_class.testing_frameworks:
-                        framework_group = self.map_testing_framework_group(test_framework_in_class.value)
+                    framework_values = [test_framework.value for test_framework in test_class.testing_frameworks]
+                    for framework_value in framework_values:
+                        framework_group = self.map_testing_framework_group(framework_value)
                         # if framework_group != '':
-                        if framework_group not in testing_framework_upset_diagram:
-                            testing_framework_upset_diagram[
-                                framework_group] = [
-                                project_analysis.dataset_name]
-                        else:
-                            previous_projects = testing_framework_upset_diagram[
-                                framework_group]
-                            previous_projects.append(project_analysis.dataset_name)
-                            testing_framework_upset_diagram[framework_group] = list(
-                                set(previous_projects))
-                        if test_framework_in_class.value not in test_framework_per_class:
-                            test_framework_per_class[test_framework_in_class.value] = 1
-
-                        else:
-
-                            test_framework_per_class[test_framework_in_class.value] += 1
-                    setup_fixture_count = 0
-                    for setup_analysis in test_class.setup_analyses:
-                        if setup_analysis is None:
-                            continue
-                        setup_fixture_count += 1
-                        if setup_analysis.execution_order is None:
-                            continue
-                        if setup_analysis.execution_order == ExecutionOrder.BEFORE_CLASS:
-                            fixtures_before_class_total += 1
-                        elif setup_analysis.execution_order == ExecutionOrder.BEFORE_EACH_TEST:
-                            fixtures_before_each_test_total += 1
-                        elif setup_analysis.execution_order == ExecutionOrder.AFTER_CLASS:
-                            fixtures_after_class_total += 1
-                        elif setup_analysis.execution_order == ExecutionOrder.AFTER_EACH_TEST:
-                            fixtures_after_each_test_total += 1
-
-                    teardown_fixture_count = 0
-                    for teardown_analysis in test_class.teardown_analyses:
-                        if teardown_analysis is None:
-                            continue
-                        teardown_fixture_count += 1
-                        if teardown_analysis.execution_order is None:
-                            continue
-                        if teardown_analysis.execution_order == ExecutionOrder.BEFORE_CLASS:
-                            fixtures_before_class_total += 1
-                        elif teardown_analysis.execution_order == ExecutionOrder.BEFORE_EACH_TEST:
-                            fixtures_before_each_test_total += 1
-                        elif teardown_analysis.execution_order == ExecutionOrder.AFTER_CLASS:
-                            fixtures_after_class_total += 1
-                        elif teardown_analysis.execution_order == ExecutionOrder.AFTER_EACH_TEST:
-                            fixtures_after_each_test_total += 1
+                        testing_framework_upset_diagram[framework_group].add(dataset_name)
+                        test_framework_per_class[framework_value] += 1
+                    setup_fixture_count = count_fixtures(test_class.setup_analyses)
+                    teardown_fixture_count = count_fixtures(test_class.teardown_analyses)
                     class_fixture_count = setup_fixture_count + teardown_fixture_count
-                    fixtures_per_class.append(class_fixture_count)
-                    setup_per_class.append(setup_fixture_count)
-                    teardown_per_class.append(teardown_fixture_count)
+                    fixtures_per_class[class_index] = class_fixture_count
+                    setup_per_class[class_index] = setup_fixture_count
+                    teardown_per_class[class_index] = teardown_fixture_count
                     if setup_fixture_count > 0:
                         classes_with_setup += 1
                     if teardown_fixture_count > 0:
@@ -149,72 +144,71 @@ class OverallCharacteristics:
                     test_method_count += len(test_class.test_method_analyses)
                     top_num_tests_methods_in_class.add(len(test_class.test_method_analyses),
                                                        qualified_class_name=test_class.qualified_class_name,
-                                                       project_name=project_analysis.dataset_name)
+                                                       project_name=dataset_name)
 
                     tests_per_project += len(test_class.test_method_analyses)
-                    frameworks_in_project.extend(
-                        [test_framework.value for test_framework in test_class.testing_frameworks])
-                    testing_frameworks.extend(
-                        [test_framework.value for test_framework in test_class.testing_frameworks])
+                    frameworks_in_project.update(framework_values)
+                    testing_frameworks.extend(framework_values)
                     for test_method in test_class.test_method_analyses:
-                        test_types.append(test_method.test_type.value)
-                        test_nc_loc.append(test_method.ncloc_with_helpers)
-                        if test_method.test_type == TestType.UNIT_MODULE:
+                        test_type = test_method.test_type
+                        test_types.append(test_type.value)
+                        test_nc_loc[test_method_index] = test_method.ncloc_with_helpers
+                        test_method_index += 1
+                        focal_classes_list = test_method.focal_classes
+                        focal_class_count = len(focal_classes_list)
+                        is_focal_test = test_type in focal_test_types
+                        if is_focal_test:
+                            # One pass over the focal classes for the method total and the classes with several methods
                             focal_method_count = 0
-
-                            for fc in test_method.focal_classes:
-                                focal_method_count += len(fc.focal_method_names)
-
+                            multiple_focal_methods = []
+                            for focal_class in focal_classes_list:
+                                method_name_count = len(focal_class.focal_method_names)
+                                focal_method_count += method_name_count
+                                if method_name_count > 1:
+                                    multiple_focal_methods.append(method_name_count)
+                        if test_type == unit_module_type:
                             if focal_method_count == 1:
                                 unit_module_focal_method_one_focal_method += 1
                             elif focal_method_count > 1:
                                 unit_module_focal_method_gt_one_focal_method += 1
                             else:
                                 no_focal_method_found += 1
-                        if test_method.test_type == TestType.API:
-                            api_projects.append(project_analysis.dataset_name)
-                        if test_method.test_type == TestType.UNIT_MODULE or \
-                                test_method.test_type == TestType.INTEGRATION:
-                            focal_method_count = 0
-
-                            for fc in test_method.focal_classes:
-                                focal_method_count += len(fc.focal_method_names)
-                            if len(test_method.focal_classes) > 0:
-                                focal_class_vs_focal_method_count.append(
-                                    {"focal_class_count": len(test_method.focal_classes),
-                                     "focal_method_count": focal_method_count})
-                            if len(test_method.focal_classes) == 0:
-                                one_or_more_focal_class.append("NO CLASS DETECTED")
-                            elif len(test_method.focal_classes) == 1:
-                                one_or_more_focal_class.append("YES")
+                        if test_type == api_type:
+                            api_projects.append(dataset_name)
+                        if is_focal_test:
+                            if focal_class_count > 0:
+                                focal_class_counts.append(focal_class_count)
+                                focal_method_counts.append(focal_method_count)
+                            if focal_class_count == 0:
+                                no_focal_class_count += 1
+                            elif focal_class_count == 1:
+                                one_focal_class_count += 1
                             else:
-                                one_or_more_focal_class.append("NO")
-                            focal_classes.append(len(test_method.focal_classes))
-                            for focal_class in test_method.focal_classes:
-                                if len(focal_class.focal_method_names) > 1:
-                                    focal_methods.append(len(focal_class.focal_method_names))
+                                more_than_one_focal_class_count += 1
+                            focal_classes.append(focal_class_count)
+                            focal_methods.extend(multiple_focal_methods)
                 fixtures_per_project.append(total_fixtures)
-                if AppType.ANDROID in project_analysis.application_types:
-                    android_projects.append(project_analysis.dataset_name)
-                if len(project_analysis.test_class_analyses) > 0:
-                    if AppType.JAVA_SE in project_analysis.application_types:
-                        se_projects.append(project_analysis.dataset_name)
-                    total_application_class.append(project_analysis.application_class_count)
-                    total_application_method.append(project_analysis.application_method_count)
-                    total_cc.append(project_analysis.application_cyclomatic_complexity)
-                    total_test_methods.append(test_method_count)
-                    class_details[project_analysis.dataset_name] = {
-                        "class_count": project_analysis.application_class_count,
-                        "method_count": project_analysis.application_method_count,
-                        "cyclomatic_complexity": project_analysis.application_cyclomatic_complexity,
-                        "test_count": test_method_count}
-                    tests_per_projects.append(tests_per_project)
-                    test_class_per_project.append(test_class_count)
-                    testing_frameworks_per_project[project_analysis.dataset_name] = frameworks_in_project
+                if AppType.JAVA_SE in application_types:
+                    se_projects.append(dataset_name)
+                total_application_class.append(application_class_count)
+                total_application_method.append(application_method_count)
+                total_cc.append(application_cyclomatic_complexity)
+                total_test_methods.append(test_method_count)
+                class_details[dataset_name] = {
+                    "class_count": application_class_count,
+                    "method_count": application_method_count,
+                    "cyclomatic_complexity": application_cyclomatic_complexity,
+                    "test_count": test_method_count}
+                tests_per_projects.append(tests_per_project)
+                test_class_per_project.append(test_class_count)
+                testing_frameworks_per_project[dataset_name] = sorted(frameworks_in_project)
 
         avg_tests_per_project = np.mean(tests_per_projects)
-        median_tests_per_project = np.median(tests_per_projects)
         total_fixtures_count = sum(fixtures_per_project)
+        fixtures_before_class_total = fixture_order_counts[ExecutionOrder.BEFORE_CLASS]
+        fixtures_after_class_total = fixture_order_counts[ExecutionOrder.AFTER_CLASS]
+        fixtures_before_each_test_total = fixture_order_counts[ExecutionOrder.BEFORE_EACH_TEST]
+        fixtures_after_each_test_total = fixture_order_counts[ExecutionOrder.AFTER_EACH_TEST]
         fixtures_before_class_percentage = (
             fixtures_before_class_total / total_fixtures_count if total_fixtures_count else 0
         )
@@ -235,10 +229,15 @@ class OverallCharacteristics:
         fixtures_each_test_scope_percentage = (
             fixtures_each_test_scope_total / total_fixtures_count if total_fixtures_count else 0
         )
-        for tf in test_framework_per_class:
-            test_framework_per_class[tf] = test_framework_per_class[tf] / total_test_class
-        for a_type in app_types:
-            app_types[a_type] = app_types[a_type] / total_projects
+        # Both counters are empty when their denominator is 0, so the guard never changes a result
+        test_class_denominator = total_test_class or 1
+        test_framework_distribution: Dict[str, float] = {
+            tf: count / test_class_denominator for tf, count in test_framework_per_class.items()
+        }
+        project_denominator = total_projects or 1
+        app_type_distribution: Dict[str, float] = {
+            a_type: count / project_denominator for a_type, count in app_types.items()
+        }
 
         # Can store somewhere
         top_num_tests_methods_in_class = top_num_tests_methods_in_class.top_k_serialized()
@@ -246,7 +245,6 @@ class OverallCharacteristics:
         outlier_tracking = {
             "top_num_test_methods_in_class": top_num_tests_methods_in_class,
         }
-        df = pd.DataFrame(focal_class_vs_focal_method_count)
         # Compute distribution
         distribution_of_testing_framework = (self.extract_statistics_utils
                                              .get_distribution_percentage(testing_frameworks))
@@ -261,7 +259,9 @@ class OverallCharacteristics:
               ylabel='Percentage (%)',
               title="Distribution of Testing Frameworks",
               filename='distribution_of_testing_frameworks'))
-            self.extract_statistics_utils.upset_diagram(testing_framework_upset_diagram, 'upset_diagram')
+            self.extract_statistics_utils.upset_diagram(
+                {group: list(projects) for group, projects in testing_framework_upset_diagram.items()},
+                'upset_diagram')
             # Heatmap
             self.extract_statistics_utils.scatter_plot(total_application_class, total_test_methods,
                                                        "Application Class count",
@@ -278,13 +278,13 @@ class OverallCharacteristics:
                                                        "Test count",
                                                        "cc_vs_test_count")
             self.extract_statistics_utils.get_box_plot(
-                elements=[fc["focal_method_count"] for fc in focal_class_vs_focal_method_count],
+                elements=focal_method_counts,
                 labels=["Focal Method Count"],
                 title='',
                 filename="focal_method_box_plot"
             )
             self.extract_statistics_utils.get_box_plot(
-                elements=[fc["focal_class_count"] for fc in focal_class_vs_focal_method_count],
+                elements=focal_class_counts,
                 labels=["Focal Class Count"],
                 title='',
                 filename="focal_class_box_plot"
@@ -297,11 +297,12 @@ class OverallCharacteristics:
             #                            title="Distribution of Application types",
             #                            filename='distribution_of_application_types'))
         # api_projects = list(set(api_projects))
-        one_focal_class = len([1 for item in one_or_more_focal_class if item == "YES"]) / len(one_or_more_focal_class)
-        more_than_one_focal_class = (len([1 for item in one_or_more_focal_class if item == "NO"]) /
-                                     len(one_or_more_focal_class))
-        unable_to_generate = (len([1 for item in one_or_more_focal_class if item == "NO CLASS DETECTED"]) /
-                              len(one_or_more_focal_class))
+        focal_class_total = one_focal_class_count + more_than_one_focal_class_count + no_focal_class_count
+        one_focal_class = one_focal_class_count / focal_class_total if focal_class_total else 0
+        more_than_one_focal_class = (
+            more_than_one_focal_class_count / focal_class_total if focal_class_total else 0
+        )
+        unable_to_generate = no_focal_class_count / focal_class_total if focal_class_total else 0
         return {
             "total_application_class": sum(total_application_class),
             "avg_application_class": np.mean(total_application_class),
@@ -346,13 +347,13 @@ class OverallCharacteristics:
             "classes_with_teardown_percentage": (
                 classes_with_teardown / total_test_class if total_test_class else 0
             ),
-            "total_test_ncloc": sum(test_nc_loc),
+            "total_test_ncloc": int(test_nc_loc.sum()),
             "avg_test_ncloc": np.mean(test_nc_loc),
             "test_ncloc_distribution": self.extract_statistics_utils.get_summary_stats(
                 test_nc_loc),
-            # "median_tests_per_project": median_tests_per_project,
-            "distribution_of_testing_framework": test_framework_per_class,
-            "distribution_of_app_type": app_types,
+            # "median_tests_per_project": np.median(tests_per_projects),
+            "distribution_of_testing_framework": test_framework_distribution,
+            "distribution_of_app_type": app_type_distribution,
             # "outlier_tracking": outlier_tracking,
             "test_type_distribution": (self.extract_statistics_utils
                                        .get_distribution_percentage(test_types)),
@@ -378,7 +379,4 @@ class OverallCharacteristics:
 
     @staticmethod
     def map_testing_framework_group(testing_framework: str) -> str:
-        for item in testing_frameworks_by_type:
-            if testing_framework in testing_frameworks_by_type[item]:
-                return item
-        return ''
+        return TESTING_FRAMEWORK_TO_GROUP.get(testing_framework, '')
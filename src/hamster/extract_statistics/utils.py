@@ -127,19 +127,22 @@ class ExtractStatisticsUtils:
                 "P90": percentiles[3]}
 
     @staticmethod
-    def get_summary_stats(data: List[float]) -> dict:
-        if not data:
+    def get_summary_stats(data: List[float] | np.ndarray) -> dict:
+        # Convert once; every statistic below then reads the same array
+        values = np.asarray(data)
+        if values.size == 0:
             return {'mean': 0.0, 'min': 0.0, 'max': 0.0, 'p25': 0.0, 'p50': 0.0, 'p75': 0.0, 'p90': 0.0}
 
-        percentiles = np.percentile(data, [25, 50, 75, 90])
+        # The 0th and 100th percentiles are the min and max, so one partitioning pass yields all of them
+        percentiles = np.percentile(values, [0, 25, 50, 75, 90, 100])
         return {
-            'mean': float(np.mean(data)),
-            'min': float(np.min(data)),
-            'max': float(np.max(data)),
-            'p25': float(percentiles[0]),
-            'p50': float(percentiles[1]),
-            'p75': float(percentiles[2]),
-            'p90': float(percentiles[3]),
+            'mean': float(values.mean()),
+            'min': float(percentiles[0]),
+            'max': float(percentiles[5]),
+            'p25': float(percentiles[1]),
+            'p50': float(percentiles[2]),
+            'p75': float(percentiles[3]),
+            'p90': float(percentiles[4]),
         }
 
     @staticmethod
@@ -487,14 +490,17 @@ class TopK:
         # If keep_largest, then min_heap[0] is smallest value in heap
         # If not keep_largest, then min_heap[0] is largest value (stored as large neg) in heap
 
+        is_full = len(self._heap) >= self.k
+        # Compare against the "worst" value in heap before building the metric, most values never get in
+        if is_full and sort_index <= self._heap[0].sort_index:
+            return
+
         analysis_metric = AnalysisMetric(sort_index, value, self.metric, method_signature, qualified_class_name,
                                          project_name)
-        if len(self._heap) < self.k:
-            heapq.heappush(self._heap, analysis_metric)
+        if is_full:
+            heapq.heapreplace(self._heap, analysis_metric)
         else:
-            # Compare against the "worst" value in heap
-            if analysis_metric.sort_index > self._heap[0].sort_index:
-                heapq.heapreplace(self._heap, analysis_metric)
+            heapq.heappush(self._heap, analysis_metric)
 
     def top_k(self) -> List[AnalysisMetric]:
         """Returns top_k in sorted order.  Descending if largest, ascending if smallest."""
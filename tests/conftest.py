@@ -0,0 +1,182 @@
+import cProfile
+import io
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pstats
+
+from cldk import CLDK
+from cldk.analysis import AnalysisLevel
+
+from hamster.code_analysis.common import CommonAnalysis, Reachability
+from hamster.code_analysis.test_statistics import (
+    CallAndAssertionSequenceDetailsInfo,
+    InputAnalysis,
+    SetupAnalysisInfo,
+    TestClassAnalysisInfo,
+    TestMethodAnalysisInfo,
+)
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_PATH_RELATIVE = "resources/spring-petclinic"
+ANALYSIS_JSON_PATH_RELATIVE = "resources/output/spring-petclinic"
+PROJECT_PATH = str(BASE_DIR / PROJECT_PATH_RELATIVE)
+ANALYSIS_JSON_PATH = str(BASE_DIR / ANALYSIS_JSON_PATH_RELATIVE)
+DATASET_NAME = "spring-petclinic"
+
+_PROFILER_KEY = pytest.StashKey[cProfile.Profile]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Profile the runtime tests and print the aggregated stats at the end of the session.",
+    )
+
+
+def pytest_configure(config):
+    # Profiling is opt-in; a single profiler accumulates every profiled test of the session
+    if config.getoption("--profile"):
+        config.stash[_PROFILER_KEY] = cProfile.Profile()
+
+
+def pytest_sessionfinish(session):
+    profiler = session.config.stash.get(_PROFILER_KEY, None)
+    if profiler is None:
+        return
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).sort_stats("cumulative")
+    stats.print_stats(20)
+    print("\nProfile stats for the profiled tests:\n")
+    print(stream.getvalue())
+
+
+# The analysis is only read by the tests, so it is built once for the whole session.
+# CLDK persists the symbol table under ANALYSIS_JSON_PATH and reloads it on later runs.
+@pytest.fixture(scope="session")
+def analysis():
+    return CLDK(language="java").analysis(
+        project_path=PROJECT_PATH,
+        analysis_level=AnalysisLevel.symbol_table,
+        analysis_json_path=ANALYSIS_JSON_PATH,
+        eager=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def common_analysis(analysis):
+    return CommonAnalysis(analysis)
+
+
+@pytest.fixture(scope="session")
+def test_class_data(common_analysis):
+    return common_analysis.get_test_methods_classes_and_application_classes()
+
+
+@pytest.fixture(scope="session")
+def test_class_methods(test_class_data):
+    return test_class_data[0]
+
+
+@pytest.fixture(scope="session")
+def application_classes(test_class_data):
+    return test_class_data[1]
+
+
+@pytest.fixture(scope="session")
+def analysis_data(analysis, common_analysis, test_class_methods, application_classes):
+    return SimpleNamespace(
+        analysis=analysis,
+        common_analysis=common_analysis,
+        dataset_name=DATASET_NAME,
+        test_class_methods=test_class_methods,
+        application_class=application_classes,
+    )
+
+
+@pytest.fixture(scope="session")
+def method_details_map(analysis, test_class_methods):
+    # Method details of every test method, looked up once and shared by the per-method tests
+    return {
+        (qualified_class_name, method_signature): analysis.get_method(qualified_class_name, method_signature)
+        for qualified_class_name, methods in test_class_methods.items()
+        for method_signature in methods
+    }
+
+
+@pytest.fixture(scope="session")
+def frameworks_by_class(common_analysis, test_class_methods):
+    return {
+        qualified_class_name: common_analysis.get_testing_frameworks_for_class(qualified_class_name)
+        for qualified_class_name in test_class_methods
+    }
+
+
+@pytest.fixture(scope="session")
+def setup_methods_by_class(setup_analysis, test_class_methods):
+    return {
+        qualified_class_name: setup_analysis.get_setup_methods(qualified_class_name=qualified_class_name)
+        for qualified_class_name in test_class_methods
+    }
+
+
+@pytest.fixture(scope="session")
+def interfaces(analysis):
+    all_classes = analysis.get_classes()
+    return [cls_name for cls_name, details in all_classes.items() if details.is_interface]
+
+
+@pytest.fixture(scope="session")
+def reachability(analysis):
+    return Reachability(analysis)
+
+
+@pytest.fixture(scope="session")
+def input_analysis(analysis):
+    return InputAnalysis(analysis)
+
+
+@pytest.fixture(scope="session")
+def setup_analysis(analysis):
+    return SetupAnalysisInfo(analysis)
+
+
+@pytest.fixture(scope="session")
+def test_class_analysis(analysis, application_classes):
+    return TestClassAnalysisInfo(analysis, DATASET_NAME, application_classes)
+
+
+@pytest.fixture(scope="session")
+def test_method_analysis(analysis, application_classes):
+    return TestMethodAnalysisInfo(analysis, DATASET_NAME, application_classes)
+
+
+@pytest.fixture(scope="session")
+def call_and_assertion_info(analysis):
+    return CallAndAssertionSequenceDetailsInfo(analysis, DATASET_NAME)
+
+
+@pytest.fixture
+def time_tracker(request):
+    start_time = time.perf_counter_ns()
+    yield
+    duration = (time.perf_counter_ns() - start_time) / 1e9
+    print(f"\nTest {request.node.nodeid} took {duration:.4f} seconds.")
+
+
+@pytest.fixture
+def profiled_time_tracker(request):
+    profiler = request.config.stash.get(_PROFILER_KEY, None)
+    start_time = time.perf_counter_ns()
+    if profiler is not None:
+        profiler.enable()
+    yield
+    if profiler is not None:
+        profiler.disable()
+    duration = (time.perf_counter_ns() - start_time) / 1e9
+    print(f"\nTest {request.node.nodeid} took {duration:.4f} seconds.")
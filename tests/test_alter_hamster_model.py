@@ -0,0 +1,177 @@
+from types import SimpleNamespace
+
+import pytest
+
+from hamster.code_analysis.model.models import (
+    ProjectAnalysis,
+    SetupAnalysis,
+    TestClassAnalysis,
+    TestingFramework,
+    TestMethodAnalysis,
+    TestType,
+)
+from hamster.extract_statistics.alter_hamster_model.alter_hamster_model import (
+    HamsterModelAlterer,
+)
+
+TEST_CLASS = "org.example.CalculatorTests"
+SETUP_METHOD = "setUp()"
+TEST_METHOD = "testAdd()"
+
+
+def _method(declaration, statements, cyclomatic_complexity):
+    body = "\n".join(f"    {statement}" for statement in statements)
+    return SimpleNamespace(
+        declaration=declaration,
+        code="{\n" + body + "\n}",
+        cyclomatic_complexity=cyclomatic_complexity,
+        call_sites=[],
+        modifiers=["public"],
+        annotations=[],
+    )
+
+
+# NCLOC of each method is its declaration, its statements and the closing brace
+METHODS = {
+    SETUP_METHOD: _method(
+        "public void setUp()",
+        ["calculator = createCalculator();"],
+        1,
+    ),
+    "createCalculator()": _method(
+        "private Calculator createCalculator()",
+        [
+            "Calculator calculator = new Calculator();",
+            "calculator.clear();",
+            "return calculator;",
+        ],
+        3,
+    ),
+    "resetAndAdd()": _method(
+        "private int resetAndAdd()",
+        ["setUp();", "return calculator.add(1, 2);"],
+        2,
+    ),
+    "resetAndSubtract()": _method(
+        "private int resetAndSubtract()",
+        ["setUp();", "return calculator.subtract(3, 2);"],
+        2,
+    ),
+    TEST_METHOD: _method(
+        "public void testAdd()",
+        ["assertEquals(3, resetAndAdd());", "assertEquals(1, resetAndSubtract());"],
+        1,
+    ),
+}
+
+# The test method reaches the setup method, itself a root, through two different helpers
+CALL_GRAPH = {
+    SETUP_METHOD: ["createCalculator()"],
+    "createCalculator()": [],
+    "resetAndAdd()": [SETUP_METHOD],
+    "resetAndSubtract()": [SETUP_METHOD],
+    TEST_METHOD: ["resetAndAdd()", "resetAndSubtract()"],
+}
+
+
+class FakeAnalysis:
+    def get_classes(self):
+        return {TEST_CLASS: self.get_class(TEST_CLASS)}
+
+    def get_class(self, qualified_class_name):
+        if qualified_class_name != TEST_CLASS:
+            return None
+        return SimpleNamespace(
+            is_interface=False,
+            modifiers=["public"],
+            implements_list=[],
+            extends_list=[],
+            annotations=[],
+        )
+
+    def get_method(self, qualified_class_name, method_signature):
+        if qualified_class_name != TEST_CLASS:
+            return None
+        return METHODS.get(method_signature)
+
+    def get_methods_in_class(self, qualified_class_name):
+        return METHODS if qualified_class_name == TEST_CLASS else {}
+
+    def get_java_file(self, qualified_class_name):
+        return "src/test/java/org/example/CalculatorTests.java"
+
+    def get_java_compilation_unit(self, file_path):
+        return SimpleNamespace(imports=[])
+
+    def get_callees(self, source_class_name, source_method_declaration, using_symbol_table):
+        return {
+            "callee_details": [
+                {
+                    "callee_method": SimpleNamespace(
+                        klass=TEST_CLASS,
+                        method=SimpleNamespace(signature=callee_signature),
+                    ),
+                    "calling_lines": [1],
+                }
+                for callee_signature in CALL_GRAPH.get(source_method_declaration, [])
+            ]
+        }
+
+
+@pytest.fixture
+def alterer(tmp_path):
+    project_analysis = ProjectAnalysis(
+        dataset_name="calculator",
+        application_class_count=0,
+        application_method_count=0,
+        application_cyclomatic_complexity=0,
+        application_types=[],
+        test_class_analyses=[
+            TestClassAnalysis(
+                qualified_class_name=TEST_CLASS,
+                testing_frameworks=[TestingFramework.JUNIT5],
+                setup_analyses=[SetupAnalysis(method_signature=SETUP_METHOD)],
+                teardown_analyses=[],
+                test_method_analyses=[
+                    TestMethodAnalysis(
+                        qualified_class_name=TEST_CLASS,
+                        method_signature=TEST_METHOD,
+                        method_declaration=METHODS[TEST_METHOD].declaration,
+                        test_type=TestType.UNIT,
+                        ncloc=0,
+                    )
+                ],
+            )
+        ],
+    )
+    project_analysis_file = tmp_path / "hamster.json"
+    project_analysis_file.write_text(project_analysis.model_dump_json())
+    return HamsterModelAlterer(
+        analysis_path="",
+        project_analysis_file=str(project_analysis_file),
+        store_path=str(tmp_path / "new_model" / "hamster.json"),
+        analysis=FakeAnalysis(),
+    )
+
+
+def test_alter_method_metrics_counts_roots_reached_from_other_roots(alterer):
+    # Fixtures are altered first, so the setup method is a root before the test method reaches it
+    alterer._alter_method_metrics(ncloc=True, cyclo=True, include_fixtures=True)
+    alterer._alter_method_metrics(helper_methods=True)
+    test_class = alterer.project_analysis.test_class_analyses[0]
+    setup_method = test_class.setup_analyses[0]
+    test_method = test_class.test_method_analyses[0]
+
+    assert setup_method.ncloc == 3
+    assert setup_method.ncloc_with_helpers == 3 + 5
+    assert setup_method.cyclomatic_complexity == 1
+    assert setup_method.cyclomatic_complexity_with_helpers == 1 + 3
+
+    # The setup method and its helper are counted once through each of the two helpers that call it
+    assert test_method.number_of_helper_methods == 6
+    assert test_method.helper_method_ncloc == 4 + 4 + 2 * 3 + 2 * 5
+    assert test_method.ncloc == 4
+    assert test_method.ncloc_with_helpers == 4 + 4 + 4 + 2 * 3 + 2 * 5
+    # The method's own complexity, not that of the last helper visited
+    assert test_method.cyclomatic_complexity == 1
+    assert test_method.cyclomatic_complexity_with_helpers == 1 + 2 + 2 + 2 * 1 + 2 * 3
@@ -1,14 +1,5 @@
-import time
-from pathlib import Path
-from types import SimpleNamespace
 from typing import List
 
-import pytest
-
-from cldk import CLDK
-from cldk.analysis import AnalysisLevel
-
-from hamster.code_analysis.common import CommonAnalysis
 from hamster.code_analysis.focal_class_method.focal_class_method import FocalClassMethod
 from hamster.code_analysis.model.models import (
     FocalClass,
@@ -23,40 +14,6 @@ from hamster.code_analysis.test_statistics import (
     TestMethodAnalysisInfo,
 )
 
-BASE_DIR = Path(__file__).resolve().parent
-PROJECT_PATH_RELATIVE = "resources/spring-petclinic"
-ANALYSIS_JSON_PATH_RELATIVE = "resources/output/spring-petclinic"
-PROJECT_PATH = str(BASE_DIR / PROJECT_PATH_RELATIVE)
-ANALYSIS_JSON_PATH = str(BASE_DIR / ANALYSIS_JSON_PATH_RELATIVE)
-DATASET_NAME = "spring-petclinic"
-
-
-@pytest.fixture
-def analysis_data(request):
-    start_time = time.time()
-    analysis = CLDK(language="java").analysis(
-        project_path=PROJECT_PATH,
-        analysis_level=AnalysisLevel.symbol_table,
-        analysis_json_path=ANALYSIS_JSON_PATH,
-        eager=False,
-    )
-    dataset_name = DATASET_NAME
-
-    common_analysis = CommonAnalysis(analysis)
-    test_class_methods, application_class = (
-        common_analysis.get_test_methods_classes_and_application_classes()
-    )
-
-    yield SimpleNamespace(
-        analysis=analysis,
-        dataset_name=dataset_name,
-        test_class_methods=test_class_methods,
-        application_class=application_class,
-    )
-
-    duration = time.time() - start_time
-    print(f"\nTest {request.node.nodeid} took {duration:.4f} seconds.")
-
 
 def test_hamster(analysis_data):
     project_analysis = ProjectAnalysisInfo(
@@ -110,9 +67,9 @@ def test_method_analysis(analysis_data):
         "org.springframework.samples.petclinic.service.ClinicServiceTests"
     )
     method_signature = "shouldInsertOwner()"
-    testing_frameworks = CommonAnalysis(
-        analysis_data.analysis
-    ).get_testing_frameworks_for_class(qualified_class_name=qualified_class_name)
+    testing_frameworks = analysis_data.common_analysis.get_testing_frameworks_for_class(
+        qualified_class_name=qualified_class_name
+    )
     setup_methods = SetupAnalysisInfo(analysis_data.analysis).get_setup_methods(
         qualified_class_name=qualified_class_name,
     )
@@ -130,16 +87,14 @@ def test_method_analysis(analysis_data):
     assert len(method_analysis.call_assertion_sequences) == 2
 
 
-def test_all_call_and_assertion_sequences(analysis_data):
+def test_all_call_and_assertion_sequences(analysis_data, frameworks_by_class):
     """Quick test to see if call and assertion info can be generated for all test methods in the project."""
 
     call_and_assertion_info = CallAndAssertionSequenceDetailsInfo(
         analysis_data.analysis, analysis_data.dataset_name
     )
     for qualified_class_name in analysis_data.test_class_methods:
-        testing_frameworks = CommonAnalysis(
-            analysis_data.analysis
-        ).get_testing_frameworks_for_class(qualified_class_name=qualified_class_name)
+        testing_frameworks = frameworks_by_class[qualified_class_name]
         for method_signature in analysis_data.test_class_methods[qualified_class_name]:
             print(
                 f"Attempting for method {method_signature} with qualified class {qualified_class_name}"
@@ -155,9 +110,7 @@ def test_all_call_and_assertion_sequences(analysis_data):
 
 
 def test_focal_classes(analysis_data):
-    _, all_application_classes = CommonAnalysis(
-        analysis_data.analysis
-    ).get_test_methods_classes_and_application_classes()
+    all_application_classes = analysis_data.application_class
 
     qualified_class_name = "org.springframework.samples.petclinic.model.ValidatorTests"
     method_signature = "shouldNotValidateWhenFirstNameEmpty()"
@@ -213,7 +166,4 @@ def test_focal_classes(analysis_data):
 
 
 def get_focal_class_names(classes: List[FocalClass]) -> List[str]:
-    focal_class_names = []
-    for cls in classes:
-        focal_class_names.append(cls.focal_class)
-    return focal_class_names
+    return [cls.focal_class for cls in classes]